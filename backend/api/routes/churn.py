@@ -22,7 +22,7 @@ from analysis import (
     get_intervention_recommendations,
 )
 from models import (
-    ChurnPredictor,
+    get_predictor,
     get_model_info,
     get_calibration_report,
     get_reliability_diagram_data,
@@ -90,7 +90,7 @@ async def customer_churn_prediction(customer_id: str) -> Dict[str, Any]:
     Returns probability, risk level, and explanation with SHAP values.
     """
     try:
-        predictor = ChurnPredictor()
+        predictor = get_predictor()
         result = predictor.predict_single(customer_id)
 
         if 'error' in result:
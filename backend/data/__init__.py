@@ -17,8 +17,8 @@ from .schema import (
     RepPerformance
 )
 from .database import (
-    get_connection, get_db, init_database, load_dataframe,
-    query_to_df, execute_query, get_table_count, table_exists,
+    get_connection, get_db, init_database, bulk_load, bulk_load_parquet, load_dataframe,
+    query_to_df, execute_query, get_data_version, get_table_count, table_exists,
     get_database_stats, get_funnel_data, get_customer_health_data,
     get_mrr_movements_summary, get_rep_performance
 )
@@ -36,8 +36,8 @@ __all__ = [
     'RevenueAtRisk', 'ActionItem', 'SimulatorResult', 'LTVCACMetrics', 'WaterfallItem',
     'RepPerformance',
     # Database functions
-    'get_connection', 'get_db', 'init_database', 'load_dataframe',
-    'query_to_df', 'execute_query', 'get_table_count', 'table_exists',
+    'get_connection', 'get_db', 'init_database', 'bulk_load', 'bulk_load_parquet', 'load_dataframe',
+    'query_to_df', 'execute_query', 'get_data_version', 'get_table_count', 'table_exists',
     'get_database_stats', 'get_funnel_data', 'get_customer_health_data',
     'get_mrr_movements_summary', 'get_rep_performance',
     # Generator
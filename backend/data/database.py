@@ -220,19 +220,46 @@ def init_database():
         # Compound indexes for common multi-column filters
         conn.execute("CREATE INDEX idx_customers_status_health ON customers(status, health_score)")
         conn.execute("CREATE INDEX idx_customers_status_size ON customers(status, company_size)")
-        conn.execute("CREATE INDEX idx_customers_status_churn ON customers(status, churn_probability)")
-        conn.execute("CREATE INDEX idx_usage_customer_date ON usage_events(customer_id, event_date)")
-        conn.execute("CREATE INDEX idx_mrr_customer_date ON mrr_movements(customer_id, movement_date)")
-        conn.execute("CREATE INDEX idx_opportunities_stage_date ON opportunities(current_stage, created_date)")
+        conn.execute(
+            "CREATE INDEX idx_customers_status_churn ON customers(status, churn_probability)"
+        )
+        conn.execute(
+            "CREATE INDEX idx_usage_customer_date ON usage_events(customer_id, event_date)"
+        )
+        conn.execute(
+            "CREATE INDEX idx_mrr_customer_date ON mrr_movements(customer_id, movement_date)"
+        )
+        conn.execute(
+            "CREATE INDEX idx_opportunities_stage_date "
+            "ON opportunities(current_stage, created_date)"
+        )
 
         print("Database schema initialized successfully")
 
 
+def bulk_load(conn: duckdb.DuckDBPyConnection, table_name: str, df: pd.DataFrame):
+    """
+    Insert a DataFrame into an existing table in one statement.
+
+    The DataFrame is registered with DuckDB as a view and scanned directly,
+    so no intermediate file or per-row inserts are involved. Inserting into
+    the table created by init_database keeps its keys and indexes.
+    """
+    view_name = f"_bulk_{table_name}"
+    conn.register(view_name, df)
+    try:
+        conn.execute(f"INSERT INTO {table_name} SELECT * FROM {view_name}")
+    finally:
+        conn.unregister(view_name)
+
+
+def bulk_load_parquet(conn: duckdb.DuckDBPyConnection, table_name: str, path: str):
+    """Insert a Parquet file into an existing table, scanned directly by DuckDB."""
+    conn.execute(f"INSERT INTO {table_name} SELECT * FROM read_parquet(?)", [str(path)])
+
+
 def load_dataframe(table_name: str, df: pd.DataFrame):
     """Load a pandas DataFrame into a table."""
-    import tempfile
-    import os
-
     # Convert any object columns that might be enums to strings
     df_copy = df.copy()
     for col in df_copy.columns:
@@ -243,17 +270,8 @@ def load_dataframe(table_name: str, df: pd.DataFrame):
                 lambda x: x.value if hasattr(x, 'value') else (str(x) if pd.notna(x) else None)
             )
 
-    # Write to temporary parquet file and load from there
-    with tempfile.NamedTemporaryFile(suffix='.parquet', delete=False) as f:
-        temp_path = f.name
-
-    try:
-        df_copy.to_parquet(temp_path, index=False)
-        with get_db() as conn:
-            conn.execute(f"INSERT INTO {table_name} SELECT * FROM read_parquet('{temp_path}')")
-    finally:
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+    with get_db() as conn:
+        bulk_load(conn, table_name, df_copy)
 
 
 def query_to_df(query: str, params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
@@ -272,6 +290,22 @@ def execute_query(query: str, params: Optional[Dict[str, Any]] = None) -> List[t
         return conn.execute(query).fetchall()
 
 
+def get_data_version() -> int:
+    """
+    Cheap stamp that changes whenever the database is written.
+
+    Uses the modification time of the database file and its write-ahead
+    log, so no connection is opened.
+    """
+    version = 0
+    for path in (DB_PATH, DB_PATH.with_name(DB_PATH.name + '.wal')):
+        try:
+            version = max(version, path.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
+    return version
+
+
 def get_table_count(table_name: str) -> int:
     """Get row count for a table."""
     with get_db() as conn:
@@ -13,42 +13,687 @@ Run this module directly to generate fresh data:
     python -m backend.data.generator
 """
 
+import os
 import uuid
 import random
-from datetime import date, datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from itertools import repeat
+from typing import Callable, Iterator, List, Dict, NamedTuple, Tuple, Optional
+import duckdb
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit; kernels run as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 from .assumptions import (
     DEFAULT_ASSUMPTIONS, DATA_START_DATE, DATA_END_DATE,
     AllAssumptions, CompanySize, LeadChannel, Industry,
     OpportunityStage, CustomerStatus, MRRMovementType
 )
-from .database import init_database, load_dataframe, get_db
+from .database import init_database, bulk_load, bulk_load_parquet, get_db
+
+RANDOM_SEED = 42
 
 fake = Faker()
-Faker.seed(42)
-random.seed(42)
-np.random.seed(42)
+Faker.seed(RANDOM_SEED)
+
+# Faker is slow per call (~100us), so company names are drawn from a pool
+# generated once per run; repeats mimic real-world name collisions.
+COMPANY_POOL_SIZE = 5000
+
+
+# Pipeline stages in order; index positions are the stage codes used by the
+# stage-progression kernel ('Closed Lost' follows the won path).
+PIPELINE_STAGES = ['Lead', 'MQL', 'SQL', 'Opportunity', 'Negotiation', 'Closed Won', 'Closed Lost']
+STAGE_KEYS = ['lead_to_mql', 'mql_to_sql', 'sql_to_opportunity',
+              'opportunity_to_negotiation', 'negotiation_to_closed']
+
+
+@njit(cache=True)
+def _simulate_stages(
+    size_codes, channel_codes, rep_perfs, days_left,
+    base_conv, seg_mult, channel_mult, base_days, velocity_mult, cv,
+    conv_draws, day_draws, loss_delay_draws
+):
+    """
+    Simulate pipeline progression for every lead.
+
+    All randomness is pre-drawn by the caller: ``conv_draws`` are uniforms per
+    stage attempt, ``day_draws`` are unit exponentials per stage and
+    ``loss_delay_draws`` are days between the last stage and a loss. Day
+    offsets are relative to each lead's created date.
+
+    Returns per-lead (final_stage, is_won [-1 open, 0 lost, 1 won],
+    close_offset [-1 if open], loss_stage [-1 if not lost]) followed by the
+    transition arrays (lead index, from stage, to stage, day offset, days in
+    previous stage), already trimmed to the number of transitions.
+    """
+    n_leads = size_codes.shape[0]
+    n_steps = base_conv.shape[0]
+    closed_lost = n_steps + 1
+
+    final_stage = np.zeros(n_leads, np.int8)
+    is_won = np.full(n_leads, -1, np.int8)
+    close_offset = np.full(n_leads, -1, np.int32)
+    loss_stage = np.full(n_leads, -1, np.int8)
+
+    max_transitions = n_leads * n_steps
+    trans_lead = np.empty(max_transitions, np.int32)
+    trans_from = np.empty(max_transitions, np.int8)
+    trans_to = np.empty(max_transitions, np.int8)
+    trans_offset = np.empty(max_transitions, np.int32)
+    trans_days = np.empty(max_transitions, np.int32)
+    n_trans = 0
+
+    for i in range(n_leads):
+        size = size_codes[i]
+        stage = 0
+        offset = 0
+
+        for s in range(n_steps):
+            conv = min(0.95, base_conv[s] * seg_mult[size, s]
+                       * channel_mult[channel_codes[i]] * rep_perfs[i])
+
+            if conv_draws[i, s] < conv:
+                # Convert to next stage
+                prev_stage = stage
+                stage = s + 1
+
+                # Calculate time to advance
+                days = max(1, int(day_draws[i, s] * base_days[s] * velocity_mult[size] * cv))
+                if offset + days > days_left[i]:
+                    break
+
+                trans_lead[n_trans] = i
+                trans_from[n_trans] = prev_stage
+                trans_to[n_trans] = stage
+                trans_offset[n_trans] = offset + days
+                trans_days[n_trans] = days
+                n_trans += 1
+                offset += days
+
+                if stage == n_steps:
+                    is_won[i] = 1
+                    close_offset[i] = offset
+            else:
+                # Lost at this stage; only counts if the lead made it past Lead
+                if stage != 0:
+                    close = min(offset + loss_delay_draws[i], days_left[i])
+                    is_won[i] = 0
+                    close_offset[i] = close
+                    loss_stage[i] = stage
+
+                    trans_lead[n_trans] = i
+                    trans_from[n_trans] = stage
+                    trans_to[n_trans] = closed_lost
+                    trans_offset[n_trans] = close
+                    trans_days[n_trans] = close - offset
+                    n_trans += 1
+                    stage = closed_lost
+                break
+
+        final_stage[i] = stage
+
+    return (
+        final_stage, is_won, close_offset, loss_stage,
+        trans_lead[:n_trans], trans_from[:n_trans], trans_to[:n_trans],
+        trans_offset[:n_trans], trans_days[:n_trans]
+    )
+
+
+# MRR movement types, indexed by the type codes emitted by _simulate_mrr
+MRR_MOVEMENT_TYPES = ('New', 'Expansion', 'Contraction', 'Churn')
+MRR_MONTH_DAYS = 30
+
+
+@njit(cache=True)
+def _simulate_mrr(
+    initial_mrrs, month_ptr, churn_offsets, expansion_prob, contraction_prob,
+    gate_draws, expansion_pcts, contraction_pcts
+):
+    """
+    Simulate the MRR lifecycle (new, monthly expansion/contraction, churn)
+    for every customer.
+
+    Customer ``i`` owns the simulated months ``month_ptr[i]:month_ptr[i + 1]``
+    of the pre-drawn ``gate_draws`` (two uniforms per month: expansion gate,
+    contraction gate) and triangular ``expansion_pcts``/``contraction_pcts``,
+    and churns at ``churn_offsets[i]`` unless it is -1. Day offsets are
+    relative to each customer's start date.
+
+    Returns (n_movements, customer index, day offset, type code, amount,
+    previous MRR, new MRR, current MRR per customer, 0 once churned). The
+    movement arrays are sized for the worst case and only the first
+    ``n_movements`` are valid.
+    """
+    n_customers = initial_mrrs.shape[0]
+    capacity = 2 * n_customers + month_ptr[n_customers]
+
+    out_customer = np.empty(capacity, np.int32)
+    out_offset = np.empty(capacity, np.int32)
+    out_type = np.empty(capacity, np.int8)
+    out_amount = np.empty(capacity, np.float64)
+    out_prev = np.empty(capacity, np.float64)
+    out_new = np.empty(capacity, np.float64)
+    final_mrr = np.empty(n_customers, np.float64)
+    cursor = 0
+
+    for i in range(n_customers):
+        mrr = initial_mrrs[i]
+
+        # New customer movement
+        out_customer[cursor] = i
+        out_offset[cursor] = 0
+        out_type[cursor] = 0
+        out_amount[cursor] = mrr
+        out_prev[cursor] = 0.0
+        out_new[cursor] = mrr
+        cursor += 1
+
+        first = month_ptr[i]
+        for m in range(first, month_ptr[i + 1]):
+            previous = mrr
+            if gate_draws[m, 0] < expansion_prob:
+                change = mrr * expansion_pcts[m]
+                movement_type = 1
+            elif gate_draws[m, 1] < contraction_prob:
+                change = -mrr * contraction_pcts[m]
+                movement_type = 2
+            else:
+                continue
+            mrr += change
+
+            out_customer[cursor] = i
+            out_offset[cursor] = (m - first + 1) * MRR_MONTH_DAYS
+            out_type[cursor] = movement_type
+            out_amount[cursor] = change
+            out_prev[cursor] = previous
+            out_new[cursor] = mrr
+            cursor += 1
+
+        # Churn movement if applicable
+        if churn_offsets[i] >= 0:
+            out_customer[cursor] = i
+            out_offset[cursor] = churn_offsets[i]
+            out_type[cursor] = 3
+            out_amount[cursor] = -mrr
+            out_prev[cursor] = mrr
+            out_new[cursor] = 0.0
+            cursor += 1
+            mrr = 0.0
+
+        final_mrr[i] = mrr
+
+    return cursor, out_customer, out_offset, out_type, out_amount, out_prev, out_new, final_mrr
+
+
+# Column layouts for entities accumulated column-wise (dict of lists) rather
+# than as one dict per row
+LEAD_COLUMNS = ('lead_id', 'created_date', 'channel', 'company_name', 'company_size',
+                'industry', 'estimated_acv', 'assigned_rep_id')
+OPPORTUNITY_COLUMNS = ('opportunity_id', 'lead_id', 'company_name', 'created_date',
+                       'current_stage', 'amount', 'close_date', 'is_won', 'loss_reason',
+                       'assigned_rep_id', 'company_size', 'channel', 'industry')
+TRANSITION_COLUMNS = ('transition_id', 'opportunity_id', 'from_stage', 'to_stage',
+                      'transition_date', 'days_in_previous_stage')
+MRR_MOVEMENT_COLUMNS = ('movement_id', 'customer_id', 'movement_date', 'movement_type',
+                        'amount', 'previous_mrr', 'new_mrr')
+USAGE_EVENT_SCHEMA = pa.schema([
+    ('event_id', pa.string()),
+    ('customer_id', pa.string()),
+    ('event_date', pa.date32()),
+    ('logins', pa.int32()),
+    ('api_calls', pa.int32()),
+    ('reports_generated', pa.int32()),
+    ('team_members_active', pa.int32()),
+    ('integrations_used', pa.int32()),
+])
+USAGE_EVENT_COLUMNS = tuple(USAGE_EVENT_SCHEMA.names)
+MARKETING_SPEND_COLUMNS = ('spend_id', 'channel', 'period_start', 'period_end',
+                           'amount', 'campaign_name')
+NPS_SURVEY_COLUMNS = ('survey_id', 'customer_id', 'survey_date', 'score',
+                      'response_text', 'responded')
+# Low-cardinality string columns, loaded as pandas categoricals (integer
+# codes plus one copy of each label) rather than one Python string per row
+CATEGORICAL_COLUMNS = frozenset({
+    'channel', 'industry', 'company_size', 'segment_focus', 'status', 'health_score',
+    'current_stage', 'from_stage', 'to_stage', 'loss_reason', 'movement_type',
+    'opportunity_type',
+})
+EXPANSION_COLUMNS = ('expansion_id', 'customer_id', 'identified_date', 'opportunity_type',
+                     'estimated_value', 'status', 'closed_date', 'actual_value')
+
+# NPS categories and customer health states, in the order used by
+# NPSAssumptions.score_distribution_by_health tuples
+NPS_CATEGORIES = ('promoter', 'passive', 'detractor')
+NPS_HEALTH_STATES = ('healthy', 'at_risk', 'churning')
+
+# Health categories in code order, with the churn-probability range drawn
+# for each; customers are bucketed on a 0-100 composite health value
+HEALTH_CATEGORIES = ('Green', 'Yellow', 'Red')
+HEALTH_CHURN_LOW = np.array([0.05, 0.25, 0.55])
+HEALTH_CHURN_HIGH = np.array([0.15, 0.45, 0.85])
+HEALTH_RECENT_DAYS = 30
+# Health-score NPS component by NPS score 0-10 (detractor/passive/promoter)
+NPS_HEALTH_SCORES = np.array([20.0] * 7 + [60.0] * 2 + [100.0] * 2)
+
+
+@njit(cache=True, parallel=True)
+def _score_health(
+    avg_logins, avg_api_calls, expected_logins, expected_api, nps, tenure_days, draws
+):
+    """
+    Bucket customers into health categories and draw churn probabilities.
+
+    ``avg_logins``/``avg_api_calls`` are NaN for customers without usage,
+    who default to Yellow with a 0.5 churn probability; ``nps`` is -1 for
+    customers who never responded. ``draws`` holds one uniform per customer
+    that is scaled into its category's churn-probability range.
+
+    Returns (category code per customer, churn probability per customer).
+    """
+    n = avg_logins.shape[0]
+    categories = np.empty(n, np.int8)
+    churn_probs = np.empty(n, np.float64)
+
+    for i in prange(n):
+        if np.isnan(avg_logins[i]):
+            categories[i] = 1
+            churn_probs[i] = 0.5
+            continue
+
+        login_score = min(100.0, avg_logins[i] / expected_logins[i] * 50)
+        api_score = min(100.0, avg_api_calls[i] / expected_api[i] * 50)
+        usage_score = (login_score + api_score) / 2
+
+        nps_score = NPS_HEALTH_SCORES[nps[i]] if nps[i] >= 0 else 0.0
+
+        # Longer tenure = more stable, max score at 300 days
+        tenure_score = min(100.0, tenure_days[i] / 3)
+
+        # Usage: 40%, NPS: 30%, Tenure: 30%
+        health_value = usage_score * 0.4 + nps_score * 0.3 + tenure_score * 0.3
+        if health_value >= 70:
+            category = 0
+        elif health_value >= 40:
+            category = 1
+        else:
+            category = 2
+
+        categories[i] = category
+        low = HEALTH_CHURN_LOW[category]
+        churn_probs[i] = low + draws[i] * (HEALTH_CHURN_HIGH[category] - low)
+
+    return categories, churn_probs
+
+
+# Free-text responses per NPS category (None = no comment), padded into one
+# table so texts can be gathered by (category, index) for a batch of surveys
+_NPS_RESPONSE_TEXTS = (
+    ("Great product, very helpful for our team!",
+     "Love the features, would recommend.",
+     "Excellent support and product quality.",
+     None),
+    ("Good product but room for improvement.",
+     "Works well for basic needs.",
+     None),
+    ("Too expensive for what we get.",
+     "Missing key features we need.",
+     "Support response times are slow.",
+     "Difficult to use, needs better UX.",
+     None),
+)
+_NPS_TEXT_COUNTS = np.array([len(texts) for texts in _NPS_RESPONSE_TEXTS])
+_NPS_TEXT_TABLE = np.array(
+    [texts + (None,) * (_NPS_TEXT_COUNTS.max() - len(texts)) for texts in _NPS_RESPONSE_TEXTS],
+    dtype=object
+)
+
+
+class _Categorical(NamedTuple):
+    """A categorical distribution cached as arrays for inverse-CDF sampling."""
+    keys: np.ndarray
+    probs: np.ndarray
+    cdf: np.ndarray
+
+    @classmethod
+    def from_dict(cls, dist: Dict[str, float]) -> '_Categorical':
+        keys = np.array(list(dist.keys()), dtype=object)
+        probs = np.array(list(dist.values()), dtype=np.float64)
+        cdf = np.cumsum(probs)
+        # Normalise so the last bucket always catches draws close to 1.0
+        return cls(keys, probs, cdf / cdf[-1])
+
+    def sample(self, rng: np.random.Generator, size=None):
+        """Draw one key (size=None) or an array of keys."""
+        return self.keys[np.searchsorted(self.cdf, rng.random(size), side='right')]
+
+
+def _empty_columns(columns: Tuple[str, ...]) -> Dict[str, List]:
+    """Create an empty columnar record store."""
+    return {col: [] for col in columns}
+
+
+def _append_row(columns: Dict[str, List], **row) -> None:
+    """Append one record to a columnar store, one value per column."""
+    for key, value in row.items():
+        columns[key].append(value)
+
+
+def _extend_columns(columns: Dict[str, List], other: Dict[str, List]) -> None:
+    """Append all records of another columnar store."""
+    for key, values in other.items():
+        columns[key].extend(values)
+
+
+def _row_count(data) -> int:
+    """Number of records in a list of dicts or a columnar store."""
+    if isinstance(data, dict):
+        return len(next(iter(data.values()), []))
+    return len(data)
+
+
+def _sequential_ids(prefix: str, n: int) -> np.ndarray:
+    """Unique record IDs ``PREFIX_00000000``, ``PREFIX_00000001``, ..."""
+    return np.char.mod(f'{prefix}_%08X', np.arange(n))
+
+
+class _ParquetSpool:
+    """
+    Append-only Parquet file for entities too large to keep as Python records.
+
+    Rows are buffered column-wise and written out as a row group every
+    ``batch_rows`` rows, so memory is bounded by one batch rather than the
+    whole table. The database loads the file directly with read_parquet.
+    """
+
+    def __init__(self, path: str, schema: pa.Schema, batch_rows: int = 50_000):
+        self.path = path
+        self.schema = schema
+        self.batch_rows = batch_rows
+        self._writer: Optional[pq.ParquetWriter] = pq.ParquetWriter(path, schema)
+        self._buffer = _empty_columns(tuple(schema.names))
+        self._n_rows = 0
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def extend(self, columns: Dict[str, List]) -> None:
+        """Append a columnar batch, writing a row group once the buffer is full."""
+        _extend_columns(self._buffer, columns)
+        self._n_rows += _row_count(columns)
+        if _row_count(self._buffer) >= self.batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if _row_count(self._buffer):
+            self._writer.write_table(pa.Table.from_pydict(self._buffer, schema=self.schema))
+            self._buffer = _empty_columns(tuple(self.schema.names))
+
+    def close(self) -> None:
+        """Write any buffered rows and finalise the file."""
+        if self._writer is not None:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the spooled rows (optionally only some columns) into a DataFrame."""
+        self.close()
+        return pq.read_table(self.path, columns=columns).to_pandas()
+
+
+# Per-customer generation functions. These are module-level and free of shared
+# state so they can be fanned out across worker processes; each call draws from
+# its own child Generator spawned by the caller, keeping output reproducible.
+
+def _usage_for_customer(
+    customer: Dict,
+    assumptions: AllAssumptions,
+    rng: np.random.Generator
+) -> Dict[str, List]:
+    """Generate daily usage events for one customer."""
+    a = assumptions.usage
+    events = _empty_columns(USAGE_EVENT_COLUMNS)
+
+    customer_id = customer['customer_id']
+    start = customer['start_date']
+    end = customer['churn_date'] if customer['churn_date'] else DATA_END_DATE
+    segment = customer['company_size']
+    base_usage = a.base_usage_by_segment.get(segment, a.base_usage_by_segment['SMB'])
+
+    # Track if customer is declining (pre-churn)
+    is_churning = customer['status'] == 'Churned'
+    days_until_churn = (customer['churn_date'] - start).days if is_churning else None
+
+    current_date = start
+    usage_multiplier = 1.0
+
+    while current_date <= end:
+        # Apply decline for churning customers
+        if is_churning and days_until_churn:
+            days_from_start = (current_date - start).days
+            days_remaining = days_until_churn - days_from_start
+
+            if days_remaining < a.decline_start_days:
+                # Linear decline
+                decline_progress = 1 - (days_remaining / a.decline_start_days)
+                usage_multiplier = 1 - (decline_progress * (1 - a.decline_final_percentage))
+
+        # Generate daily usage with some randomness
+        logins = max(0, int(base_usage['logins'] * usage_multiplier * rng.uniform(0.5, 1.5)))
+        api_calls = max(0, int(base_usage['api_calls'] * usage_multiplier * rng.uniform(0.5, 1.5)))
+        reports = max(0, int(
+            base_usage['reports_generated'] * usage_multiplier * rng.uniform(0.3, 1.7)
+        ))
+        team_members = max(1, int(
+            base_usage['team_members_active'] * usage_multiplier * rng.uniform(0.7, 1.3)
+        ))
+        integrations = max(0, int(
+            base_usage['integrations_used'] * usage_multiplier * rng.uniform(0.8, 1.2)
+        ))
+
+        # Weekend reduction
+        if current_date.weekday() >= 5:
+            logins = int(logins * 0.3)
+            api_calls = int(api_calls * 0.3)
+            reports = int(reports * 0.3)
+            team_members = int(team_members * 0.3)
+
+        _append_row(
+            events,
+            event_id=f'USE_{uuid.uuid4().hex.upper()}',
+            customer_id=customer_id,
+            event_date=current_date,
+            logins=logins,
+            api_calls=api_calls,
+            reports_generated=reports,
+            team_members_active=team_members,
+            integrations_used=integrations
+        )
+        current_date += timedelta(days=1)
+
+    return events
+
+
+def _nps_for_customer(
+    customer: Dict,
+    assumptions: AllAssumptions,
+    rng: np.random.Generator
+) -> Tuple[Dict[str, List], Optional[int]]:
+    """Generate NPS surveys for one customer; returns (surveys, latest score)."""
+    a = assumptions.nps
+
+    customer_id = customer['customer_id']
+    start = customer['start_date']
+    end = customer['churn_date'] if customer['churn_date'] else DATA_END_DATE
+
+    # Survey every 90 days
+    n_surveys = max(0, (end - start).days // a.survey_frequency_days)
+    if n_surveys == 0:
+        return _empty_columns(NPS_SURVEY_COLUMNS), None
+    offsets = np.arange(1, n_surveys + 1) * a.survey_frequency_days
+
+    # Determine customer health for each survey
+    if customer['status'] == 'Churned' and customer['churn_date']:
+        days_to_churn = (customer['churn_date'] - start).days - offsets
+        health_codes = np.select([days_to_churn < 30, days_to_churn < 90], [2, 1], default=0)
+    else:
+        health_codes = np.zeros(n_surveys, dtype=np.int64)
+
+    responded = rng.random(n_surveys) < a.response_rate
+
+    # Determine NPS category based on health (inverse CDF per survey)
+    cum_dist = np.cumsum([a.score_distribution_by_health[h] for h in NPS_HEALTH_STATES], axis=1)
+    categories = (rng.random(n_surveys)[:, None] >= cum_dist[health_codes]).sum(axis=1)
+    categories = np.minimum(categories, len(NPS_CATEGORIES) - 1)
+
+    scores = np.where(
+        categories == 0, rng.integers(9, 11, n_surveys),
+        np.where(categories == 1, rng.integers(7, 9, n_surveys), rng.integers(0, 7, n_surveys))
+    )
+    text_idx = (rng.random(n_surveys) * _NPS_TEXT_COUNTS[categories]).astype(np.int64)
+    texts = _NPS_TEXT_TABLE[categories, text_idx]
+
+    surveys = {
+        'survey_id': [f'NPS_{uuid.uuid4().hex[:8].upper()}' for _ in range(n_surveys)],
+        'customer_id': [customer_id] * n_surveys,
+        'survey_date': [start + timedelta(days=int(d)) for d in offsets],
+        'score': np.where(responded, scores, np.nan).tolist(),
+        'response_text': np.where(responded, texts, None).tolist(),
+        'responded': responded.tolist(),
+    }
+
+    latest_score = int(scores[responded][-1]) if responded.any() else None
+    return surveys, latest_score
+
+
+def _expansion_for_customer(
+    customer: Dict,
+    assumptions: AllAssumptions,
+    rng: np.random.Generator
+) -> Dict[str, List]:
+    """Generate expansion/upsell opportunities for one active customer."""
+    a = assumptions.expansion
+    opportunities = _empty_columns(EXPANSION_COLUMNS)
+
+    customer_id = customer['customer_id']
+    current_mrr = customer['current_mrr']
+    start = customer['start_date']
+
+    # Check for expansion opportunities every 30 days
+    check_date = start + timedelta(days=90)  # Start checking after 90 days
+
+    while check_date <= DATA_END_DATE:
+        if rng.random() < a.monthly_expansion_probability:
+            # Create expansion opportunity
+            estimated_value = current_mrr * rng.triangular(
+                a.expansion_percentage_range['min'] * 12,
+                a.expansion_percentage_range['median'] * 12,
+                a.expansion_percentage_range['max'] * 12
+            )
+
+            # Determine status based on time
+            days_since_identified = (DATA_END_DATE - check_date).days
+
+            if days_since_identified < 30:
+                status = 'Identified'
+                closed_date = None
+                actual_value = None
+            elif days_since_identified < 60:
+                status = 'In Progress'
+                closed_date = None
+                actual_value = None
+            else:
+                # Resolve the opportunity
+                if rng.random() < a.expansion_conversion_rate:
+                    status = 'Won'
+                    actual_value = estimated_value * rng.uniform(0.8, 1.2)
+                else:
+                    status = 'Lost'
+                    actual_value = None
+                closed_date = check_date + timedelta(days=int(rng.integers(30, 91)))
+                if closed_date > DATA_END_DATE:
+                    closed_date = DATA_END_DATE
+
+            _append_row(
+                opportunities,
+                expansion_id=f'EXP_{uuid.uuid4().hex[:8].upper()}',
+                customer_id=customer_id,
+                identified_date=check_date,
+                opportunity_type='Upsell' if rng.random() < 0.5 else 'Cross-sell',
+                estimated_value=round(estimated_value, 2),
+                status=status,
+                closed_date=closed_date,
+                actual_value=round(actual_value, 2) if actual_value else None
+            )
+
+        check_date += timedelta(days=30)
+
+    return opportunities
 
 
 class SyntheticDataGenerator:
     """Generates realistic synthetic SaaS data."""
 
-    def __init__(self, assumptions: AllAssumptions = DEFAULT_ASSUMPTIONS):
+    def __init__(
+        self,
+        assumptions: AllAssumptions = DEFAULT_ASSUMPTIONS,
+        n_workers: Optional[int] = None,
+        seed: int = RANDOM_SEED
+    ):
         self.assumptions = assumptions
-        self.leads: List[Dict] = []
+        self.n_workers = n_workers or os.cpu_count() or 1
+        # All randomness comes from these per-generator streams (plus Faker),
+        # never from the global numpy/random state
+        self.rng = np.random.default_rng(seed)
+        self._py_rng = random.Random(seed)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._company_pool: Optional[np.ndarray] = None
+
+        # Sampling distributions, built once from the assumptions
+        lead_gen = assumptions.lead_gen
+        self._channel_dist = _Categorical.from_dict(lead_gen.channel_distribution)
+        self._size_dist = _Categorical.from_dict(lead_gen.company_size_distribution)
+        self._industry_dist = _Categorical.from_dict(lead_gen.industry_distribution)
+        self._loss_reason_dists = {
+            stage: _Categorical.from_dict(reasons)
+            for stage, reasons in assumptions.conversion.loss_reasons.items()
+        }
+        self._default_loss_reason_dist = self._loss_reason_dists.get(
+            'opportunity', _Categorical.from_dict({'Other': 1.0})
+        )
+
+        self.leads: Dict[str, List] = _empty_columns(LEAD_COLUMNS)
         self.sales_reps: List[Dict] = []
-        self.opportunities: List[Dict] = []
-        self.stage_transitions: List[Dict] = []
+        self.opportunities: Dict[str, List] = _empty_columns(OPPORTUNITY_COLUMNS)
+        self.stage_transitions: Dict[str, List] = _empty_columns(TRANSITION_COLUMNS)
         self.customers: List[Dict] = []
-        self.usage_events: List[Dict] = []
-        self.marketing_spend: List[Dict] = []
-        self.mrr_movements: List[Dict] = []
-        self.nps_surveys: List[Dict] = []
-        self.expansion_opportunities: List[Dict] = []
+        # Usage events are the largest table, so they are spooled to disk
+        self._spool_dir = tempfile.TemporaryDirectory(prefix='saas_generator_')
+        self.usage_events = _ParquetSpool(
+            os.path.join(self._spool_dir.name, 'usage_events.parquet'), USAGE_EVENT_SCHEMA
+        )
+        self.marketing_spend: Dict[str, List] = _empty_columns(MARKETING_SPEND_COLUMNS)
+        self.mrr_movements: Dict[str, List] = _empty_columns(MRR_MOVEMENT_COLUMNS)
+        self.nps_surveys: Dict[str, List] = _empty_columns(NPS_SURVEY_COLUMNS)
+        self.expansion_opportunities: Dict[str, List] = _empty_columns(EXPANSION_COLUMNS)
 
         # Lookup maps
         self.lead_to_opp: Dict[str, str] = {}
@@ -58,6 +703,9 @@ class SyntheticDataGenerator:
     def generate_all(self):
         """Generate all synthetic data."""
         print("Generating synthetic data...")
+        self._company_pool = np.array(
+            [fake.company() for _ in range(COMPANY_POOL_SIZE)], dtype=object
+        )
 
         print("  1/10 Generating sales reps...")
         self._generate_sales_reps()
@@ -71,20 +719,29 @@ class SyntheticDataGenerator:
         print("  4/10 Generating customers...")
         self._generate_customers()
 
-        print("  5/10 Generating usage events...")
-        self._generate_usage_events()
+        # Per-customer phases are independent across customers, so they share
+        # one process pool when more than one worker is available
+        if self.n_workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers)
+        try:
+            print("  5/10 Generating usage events...")
+            self._generate_usage_events()
 
-        print("  6/10 Generating marketing spend...")
-        self._generate_marketing_spend()
+            print("  6/10 Generating marketing spend...")
+            self._generate_marketing_spend()
 
-        print("  7/10 Generating MRR movements...")
-        self._generate_mrr_movements()
+            print("  7/10 Generating MRR movements...")
+            self._generate_mrr_movements()
 
-        print("  8/10 Generating NPS surveys...")
-        self._generate_nps_surveys()
+            print("  8/10 Generating NPS surveys...")
+            self._generate_nps_surveys()
 
-        print("  9/10 Generating expansion opportunities...")
-        self._generate_expansion_opportunities()
+            print("  9/10 Generating expansion opportunities...")
+            self._generate_expansion_opportunities()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
 
         print("  10/10 Updating customer health scores...")
         self._update_customer_health_scores()
@@ -99,14 +756,17 @@ class SyntheticDataGenerator:
 
         for i in range(a.num_reps):
             # Generate performance score with normal distribution
-            perf = np.random.normal(1.0, a.performance_std_dev)
+            perf = self.rng.normal(1.0, a.performance_std_dev)
             perf = max(a.min_performance, min(a.max_performance, perf))
 
             self.sales_reps.append({
                 'rep_id': f'REP_{i+1:03d}',
                 'name': fake.name(),
-                'start_date': DATA_START_DATE - timedelta(days=random.randint(30, 365)),
-                'segment_focus': a.rep_segment_focus[i] if i < len(a.rep_segment_focus) else random.choice(segments),
+                'start_date': DATA_START_DATE - timedelta(days=self._py_rng.randint(30, 365)),
+                'segment_focus': (
+                    a.rep_segment_focus[i] if i < len(a.rep_segment_focus)
+                    else self._py_rng.choice(segments)
+                ),
                 'performance_score': round(perf, 3),
                 'is_active': True
             })
@@ -123,7 +783,7 @@ class SyntheticDataGenerator:
             monthly_leads = int(a.base_leads_per_month * seasonality_mult)
 
             # Add some random variation
-            monthly_leads = int(monthly_leads * np.random.uniform(0.9, 1.1))
+            monthly_leads = int(monthly_leads * self.rng.uniform(0.9, 1.1))
 
             # Distribute leads throughout the month
             days_in_month = 28 if current_date.month == 2 else 30 if current_date.month in [4, 6, 9, 11] else 31
@@ -135,10 +795,9 @@ class SyntheticDataGenerator:
                     break
 
                 # Generate leads for this day
-                daily_leads = int(leads_per_day * np.random.uniform(0.7, 1.3))
+                daily_leads = int(leads_per_day * self.rng.uniform(0.7, 1.3))
                 for _ in range(daily_leads):
-                    lead = self._create_lead(lead_date)
-                    self.leads.append(lead)
+                    _append_row(self.leads, **self._create_lead(lead_date))
 
             # Move to next month
             if current_date.month == 12:
@@ -150,27 +809,14 @@ class SyntheticDataGenerator:
         """Create a single lead."""
         a = self.assumptions
 
-        # Select channel
-        channel = np.random.choice(
-            list(a.lead_gen.channel_distribution.keys()),
-            p=list(a.lead_gen.channel_distribution.values())
-        )
-
-        # Select company size
-        company_size = np.random.choice(
-            list(a.lead_gen.company_size_distribution.keys()),
-            p=list(a.lead_gen.company_size_distribution.values())
-        )
-
-        # Select industry
-        industry = np.random.choice(
-            list(a.lead_gen.industry_distribution.keys()),
-            p=list(a.lead_gen.industry_distribution.values())
-        )
+        # Select channel, company size and industry
+        channel = self._channel_dist.sample(self.rng)
+        company_size = self._size_dist.sample(self.rng)
+        industry = self._industry_dist.sample(self.rng)
 
         # Generate ACV based on segment
         acv_params = a.deal_value.acv_by_segment[company_size]
-        estimated_acv = np.random.triangular(
+        estimated_acv = self.rng.triangular(
             acv_params['min'],
             acv_params['median'],
             acv_params['max']
@@ -178,7 +824,7 @@ class SyntheticDataGenerator:
 
         # Assign rep based on segment
         matching_reps = [r for r in self.sales_reps if r['segment_focus'] == company_size]
-        rep = random.choice(matching_reps) if matching_reps else random.choice(self.sales_reps)
+        rep = self._py_rng.choice(matching_reps or self.sales_reps)
 
         lead_id = f'LEAD_{uuid.uuid4().hex[:8].upper()}'
 
@@ -186,130 +832,116 @@ class SyntheticDataGenerator:
             'lead_id': lead_id,
             'created_date': lead_date,
             'channel': channel,
-            'company_name': fake.company(),
+            'company_name': self._random_company(),
             'company_size': company_size,
             'industry': industry,
             'estimated_acv': round(estimated_acv, 2),
             'assigned_rep_id': rep['rep_id']
         }
 
+    def _random_company(self) -> str:
+        """Draw a company name from the per-run pool."""
+        if self._company_pool is None:
+            return fake.company()
+        return self._company_pool[self.rng.integers(len(self._company_pool))]
+
     def _generate_opportunities(self):
         """Generate opportunities with stage transitions."""
         a = self.assumptions
+        leads = self.leads
+        n_leads = _row_count(leads)
+        n_steps = len(STAGE_KEYS)
+
+        # Encode segments and channels as integer codes for the kernel
+        sizes = self._size_dist.keys
+        channels = self._channel_dist.keys
+        size_index = {size: i for i, size in enumerate(sizes)}
+        channel_index = {channel: i for i, channel in enumerate(channels)}
+        rep_perf = {r['rep_id']: r['performance_score'] for r in self.sales_reps}
+
+        size_codes = np.array([size_index[s] for s in leads['company_size']], dtype=np.int64)
+        channel_codes = np.array([channel_index[c] for c in leads['channel']], dtype=np.int64)
+        rep_perfs = np.array([rep_perf.get(r, 1.0) for r in leads['assigned_rep_id']])
+        created_dates = np.array(leads['created_date'], dtype='datetime64[D]')
+        days_left = (np.datetime64(DATA_END_DATE) - created_dates).astype(np.int64)
+
+        base_conv = np.array([a.conversion.base_stage_conversion[k] for k in STAGE_KEYS])
+        seg_mult = np.array([
+            [a.conversion.segment_multipliers.get(size, {}).get(k, 1.0) for k in STAGE_KEYS]
+            for size in sizes
+        ])
+        channel_mult = np.array([a.conversion.channel_quality.get(c, 1.0) for c in channels])
+        base_days = np.array(
+            [a.velocity.median_stage_days[k] for k in STAGE_KEYS], dtype=np.float64
+        )
+        velocity_mult = np.array(
+            [a.velocity.segment_velocity_multipliers.get(size, 1.0) for size in sizes]
+        )
 
-        for lead in self.leads:
-            # Start all leads as opportunities at Lead stage
-            opp_id = f'OPP_{uuid.uuid4().hex[:8].upper()}'
-            self.lead_to_opp[lead['lead_id']] = opp_id
-
-            # Get conversion multipliers
-            segment_mult = a.conversion.segment_multipliers.get(lead['company_size'], {})
-            channel_mult = a.conversion.channel_quality.get(lead['channel'], 1.0)
-
-            # Get rep performance
-            rep = next((r for r in self.sales_reps if r['rep_id'] == lead['assigned_rep_id']), None)
-            rep_mult = rep['performance_score'] if rep else 1.0
-
-            # Simulate progression through stages
-            stages = ['Lead', 'MQL', 'SQL', 'Opportunity', 'Negotiation', 'Closed Won']
-            stage_keys = ['lead_to_mql', 'mql_to_sql', 'sql_to_opportunity',
-                         'opportunity_to_negotiation', 'negotiation_to_closed']
-
-            current_stage = 'Lead'
-            current_date = datetime.combine(lead['created_date'], datetime.min.time())
-            transitions = []
-            is_won = None
-            loss_reason = None
-            close_date = None
-
-            for i, (stage, stage_key) in enumerate(zip(stages[1:], stage_keys)):
-                # Calculate conversion probability
-                base_conv = a.conversion.base_stage_conversion[stage_key]
-                seg_mult = segment_mult.get(stage_key, 1.0)
-                final_conv = min(0.95, base_conv * seg_mult * channel_mult * rep_mult)
-
-                if random.random() < final_conv:
-                    # Convert to next stage
-                    prev_stage = current_stage
-                    current_stage = stage
-
-                    # Calculate time to advance
-                    base_days = a.velocity.median_stage_days[stage_key]
-                    velocity_mult = a.velocity.segment_velocity_multipliers.get(lead['company_size'], 1.0)
-                    days_in_stage = max(1, int(np.random.exponential(base_days * velocity_mult * a.velocity.cv)))
-
-                    transition_date = current_date + timedelta(days=days_in_stage)
-                    if transition_date.date() > DATA_END_DATE:
-                        break
-
-                    transitions.append({
-                        'transition_id': f'TRANS_{uuid.uuid4().hex[:8].upper()}',
-                        'opportunity_id': opp_id,
-                        'from_stage': prev_stage,
-                        'to_stage': stage,
-                        'transition_date': transition_date,
-                        'days_in_previous_stage': days_in_stage
-                    })
-
-                    current_date = transition_date
-
-                    if stage == 'Closed Won':
-                        is_won = True
-                        close_date = current_date.date()
-                else:
-                    # Lost at this stage
-                    if current_stage != 'Lead':  # Only mark as lost if made it past lead
-                        is_won = False
-                        close_date = current_date.date() + timedelta(days=random.randint(1, 14))
-                        if close_date > DATA_END_DATE:
-                            close_date = DATA_END_DATE
-
-                        # Assign loss reason
-                        stage_loss_reasons = a.conversion.loss_reasons.get(
-                            current_stage.lower().replace(' ', '_'),
-                            a.conversion.loss_reasons.get('opportunity', {'Other': 1.0})
-                        )
-                        loss_reason = np.random.choice(
-                            list(stage_loss_reasons.keys()),
-                            p=list(stage_loss_reasons.values())
-                        )
-
-                        # Create lost transition
-                        transitions.append({
-                            'transition_id': f'TRANS_{uuid.uuid4().hex[:8].upper()}',
-                            'opportunity_id': opp_id,
-                            'from_stage': current_stage,
-                            'to_stage': 'Closed Lost',
-                            'transition_date': datetime.combine(close_date, datetime.min.time()),
-                            'days_in_previous_stage': (close_date - current_date.date()).days
-                        })
-                        current_stage = 'Closed Lost'
-                    break
+        (final_stage, is_won, close_offset, loss_stage,
+         trans_lead, trans_from, trans_to, trans_offset, trans_days) = _simulate_stages(
+            size_codes, channel_codes, rep_perfs, days_left,
+            base_conv, seg_mult, channel_mult, base_days, velocity_mult, float(a.velocity.cv),
+            self.rng.random((n_leads, n_steps)),
+            self.rng.standard_exponential((n_leads, n_steps)),
+            self.rng.integers(1, 15, n_leads)
+        )
 
-            # Create opportunity record
-            self.opportunities.append({
-                'opportunity_id': opp_id,
-                'lead_id': lead['lead_id'],
-                'created_date': lead['created_date'],
-                'current_stage': current_stage,
-                'amount': lead['estimated_acv'],
-                'close_date': close_date,
-                'is_won': is_won,
-                'loss_reason': loss_reason,
-                'assigned_rep_id': lead['assigned_rep_id'],
-                'company_size': lead['company_size'],
-                'channel': lead['channel'],
-                'industry': lead['industry']
-            })
+        # Assign loss reasons per stage lost at
+        loss_reasons = np.full(n_leads, None, dtype=object)
+        for code in np.unique(loss_stage[loss_stage >= 0]):
+            stage_loss_reasons = self._loss_reason_dists.get(
+                PIPELINE_STAGES[code].lower().replace(' ', '_'),
+                self._default_loss_reason_dist
+            )
+            lost_here = loss_stage == code
+            loss_reasons[lost_here] = stage_loss_reasons.sample(self.rng, int(lost_here.sum()))
+
+        # Create opportunity records, one per lead
+        opp_ids = [f'OPP_{uuid.uuid4().hex[:8].upper()}' for _ in range(n_leads)]
+        self.lead_to_opp.update(zip(leads['lead_id'], opp_ids))
+        self.opportunities = {
+            'opportunity_id': opp_ids,
+            'lead_id': list(leads['lead_id']),
+            'company_name': list(leads['company_name']),
+            'created_date': list(leads['created_date']),
+            'current_stage': np.array(PIPELINE_STAGES, dtype=object)[final_stage].tolist(),
+            'amount': list(leads['estimated_acv']),
+            'close_date': [
+                created + timedelta(days=offset) if offset >= 0 else None
+                for created, offset in zip(leads['created_date'], close_offset.tolist())
+            ],
+            'is_won': [bool(won) if won >= 0 else None for won in is_won.tolist()],
+            'loss_reason': loss_reasons.tolist(),
+            'assigned_rep_id': list(leads['assigned_rep_id']),
+            'company_size': list(leads['company_size']),
+            'channel': list(leads['channel']),
+            'industry': list(leads['industry']),
+        }
 
-            self.stage_transitions.extend(transitions)
+        # Create stage transition records, one column at a time
+        stage_names = np.array(PIPELINE_STAGES, dtype=object)
+        transitions = self.stage_transitions
+        transitions['transition_id'].extend(
+            f'TRANS_{uuid.uuid4().hex[:8].upper()}' for _ in range(len(trans_lead))
+        )
+        transitions['opportunity_id'].extend(np.array(opp_ids, dtype=object)[trans_lead])
+        transitions['from_stage'].extend(stage_names[trans_from])
+        transitions['to_stage'].extend(stage_names[trans_to])
+        # Transition timestamps are midnight of created date + offset days
+        transitions['transition_date'].extend(
+            (created_dates[trans_lead] + trans_offset).astype('datetime64[us]').tolist()
+        )
+        transitions['days_in_previous_stage'].extend(trans_days.tolist())
 
     def _generate_customers(self):
         """Generate customer records from won opportunities."""
         a = self.assumptions
+        opps = self.opportunities
 
-        for opp in self.opportunities:
-            if opp['is_won']:
+        for i, won in enumerate(opps['is_won']):
+            if won:
+                opp = {col: values[i] for col, values in opps.items()}
                 customer_id = f'CUST_{uuid.uuid4().hex[:8].upper()}'
                 self.opp_to_customer[opp['opportunity_id']] = customer_id
 
@@ -331,9 +963,9 @@ class SyntheticDataGenerator:
 
                 while current_date < DATA_END_DATE:
                     # Check for churn (will be refined with usage data later)
-                    if random.random() < monthly_churn_prob:
+                    if self._py_rng.random() < monthly_churn_prob:
                         status = 'Churned'
-                        churn_date = current_date + timedelta(days=random.randint(1, 28))
+                        churn_date = current_date + timedelta(days=self._py_rng.randint(1, 28))
                         if churn_date > DATA_END_DATE:
                             churn_date = DATA_END_DATE
                         current_mrr = 0
@@ -341,14 +973,10 @@ class SyntheticDataGenerator:
 
                     current_date = current_date + timedelta(days=30)
 
-                # Find company name from lead
-                lead = next((l for l in self.leads if l['lead_id'] == opp['lead_id']), None)
-                company_name = lead['company_name'] if lead else fake.company()
-
                 customer = {
                     'customer_id': customer_id,
                     'opportunity_id': opp['opportunity_id'],
-                    'company_name': company_name,
+                    'company_name': opp['company_name'],
                     'company_size': opp['company_size'],
                     'industry': opp['industry'],
                     'channel': opp['channel'],
@@ -366,406 +994,229 @@ class SyntheticDataGenerator:
                 self.customers.append(customer)
                 self.customer_data[customer_id] = customer
 
-    def _generate_usage_events(self):
-        """Generate daily usage events for each customer."""
-        a = self.assumptions.usage
+    def _map_customers(self, func: Callable, customers: List[Dict]) -> Iterator:
+        """
+        Apply a per-customer generation function to every customer.
 
-        for customer in self.customers:
-            start = customer['start_date']
-            end = customer['churn_date'] if customer['churn_date'] else DATA_END_DATE
-            segment = customer['company_size']
-            base_usage = a.base_usage_by_segment.get(segment, a.base_usage_by_segment['SMB'])
-
-            # Track if customer is declining (pre-churn)
-            is_churning = customer['status'] == 'Churned'
-            days_until_churn = (customer['churn_date'] - start).days if is_churning else None
-
-            current_date = start
-            usage_multiplier = 1.0
-
-            while current_date <= end:
-                # Apply decline for churning customers
-                if is_churning and days_until_churn:
-                    days_from_start = (current_date - start).days
-                    days_remaining = days_until_churn - days_from_start
-
-                    if days_remaining < a.decline_start_days:
-                        # Linear decline
-                        decline_progress = 1 - (days_remaining / a.decline_start_days)
-                        usage_multiplier = 1 - (decline_progress * (1 - a.decline_final_percentage))
-
-                # Generate daily usage with some randomness
-                event = {
-                    'event_id': f'USE_{uuid.uuid4().hex.upper()}',
-                    'customer_id': customer['customer_id'],
-                    'event_date': current_date,
-                    'logins': max(0, int(base_usage['logins'] * usage_multiplier * np.random.uniform(0.5, 1.5))),
-                    'api_calls': max(0, int(base_usage['api_calls'] * usage_multiplier * np.random.uniform(0.5, 1.5))),
-                    'reports_generated': max(0, int(base_usage['reports_generated'] * usage_multiplier * np.random.uniform(0.3, 1.7))),
-                    'team_members_active': max(1, int(base_usage['team_members_active'] * usage_multiplier * np.random.uniform(0.7, 1.3))),
-                    'integrations_used': max(0, int(base_usage['integrations_used'] * usage_multiplier * np.random.uniform(0.8, 1.2)))
-                }
+        Each customer gets its own child Generator spawned from ``self.rng``, so
+        results are identical whether the work runs in the process pool or serially.
+        Results are yielded lazily in customer order, so callers can consume
+        them as they arrive.
+        """
+        rngs = self.rng.spawn(len(customers))
+        args = (customers, repeat(self.assumptions), rngs)
 
-                # Weekend reduction
-                if current_date.weekday() >= 5:
-                    for key in ['logins', 'api_calls', 'reports_generated', 'team_members_active']:
-                        event[key] = int(event[key] * 0.3)
+        if self._executor is not None:
+            return self._executor.map(func, *args, chunksize=64)
+        return map(func, *args)
 
-                self.usage_events.append(event)
-                current_date += timedelta(days=1)
+    def _generate_usage_events(self):
+        """Generate daily usage events for each customer."""
+        for events in self._map_customers(_usage_for_customer, self.customers):
+            self.usage_events.extend(events)
+        self.usage_events.close()
 
     def _generate_marketing_spend(self):
         """Generate monthly marketing spend by channel."""
         a = self.assumptions.marketing
+        channels = list(a.monthly_spend_by_channel.keys())
+        base_spend = np.array(list(a.monthly_spend_by_channel.values()), dtype=np.float64)
 
-        current_date = DATA_START_DATE
-        while current_date <= DATA_END_DATE:
-            # Calculate month end
-            if current_date.month == 12:
-                month_end = date(current_date.year + 1, 1, 1) - timedelta(days=1)
-            else:
-                month_end = date(current_date.year, current_date.month + 1, 1) - timedelta(days=1)
-
-            if month_end > DATA_END_DATE:
-                month_end = DATA_END_DATE
-
-            for channel, base_spend in a.monthly_spend_by_channel.items():
-                # Add variation
-                actual_spend = base_spend * np.random.uniform(1 - a.spend_cv, 1 + a.spend_cv)
+        # Calendar months in the data window; the last period is cut at the end date
+        starts = pd.date_range(DATA_START_DATE, DATA_END_DATE, freq='MS')
+        ends = np.minimum((starts + pd.offsets.MonthEnd()).values, np.datetime64(DATA_END_DATE))
+        n_months, n_channels = len(starts), len(channels)
 
-                self.marketing_spend.append({
-                    'spend_id': f'SPEND_{uuid.uuid4().hex[:8].upper()}',
-                    'channel': channel,
-                    'period_start': current_date,
-                    'period_end': month_end,
-                    'amount': round(actual_spend, 2),
-                    'campaign_name': f"{channel} - {current_date.strftime('%B %Y')}"
-                })
+        # One draw per (month, channel) with spend variation
+        spend = base_spend[None, :] * self.rng.uniform(
+            1 - a.spend_cv, 1 + a.spend_cv, size=(n_months, n_channels)
+        )
 
-            # Move to next month
-            if current_date.month == 12:
-                current_date = date(current_date.year + 1, 1, 1)
-            else:
-                current_date = date(current_date.year, current_date.month + 1, 1)
+        # Rows are month-major with channels inner, matching spend.ravel()
+        channel_col = np.tile(channels, n_months).tolist()
+        month_labels = np.repeat(starts.strftime('%B %Y'), n_channels)
+        self.marketing_spend = {
+            'spend_id': [f'SPEND_{uuid.uuid4().hex[:8].upper()}' for _ in range(spend.size)],
+            'channel': channel_col,
+            'period_start': np.repeat(starts.values.astype('datetime64[D]'), n_channels).tolist(),
+            'period_end': np.repeat(ends.astype('datetime64[D]'), n_channels).tolist(),
+            'amount': np.round(spend.ravel(), 2).tolist(),
+            'campaign_name': [
+                f"{channel} - {label}" for channel, label in zip(channel_col, month_labels)
+            ],
+        }
 
     def _generate_mrr_movements(self):
         """Generate MRR movement records."""
         a = self.assumptions.expansion
+        customers = self.customers
 
-        for customer in self.customers:
-            current_mrr = customer['initial_mrr']
-            customer_id = customer['customer_id']
-
-            # New customer movement
-            self.mrr_movements.append({
-                'movement_id': f'MRR_{uuid.uuid4().hex[:8].upper()}',
-                'customer_id': customer_id,
-                'movement_date': customer['start_date'],
-                'movement_type': 'New',
-                'amount': round(current_mrr, 2),
-                'previous_mrr': 0,
-                'new_mrr': round(current_mrr, 2)
-            })
+        # Flatten customers into arrays; months are laid out back to back
+        start_dates = np.array([c['start_date'] for c in customers], dtype='datetime64[D]')
+        end_dates = np.array(
+            [c['churn_date'] if c['churn_date'] else DATA_END_DATE for c in customers],
+            dtype='datetime64[D]'
+        )
+        initial_mrrs = np.array([c['initial_mrr'] for c in customers], dtype=np.float64)
+        is_churned = np.array(
+            [c['status'] == 'Churned' and bool(c['churn_date']) for c in customers]
+        )
+        churn_offsets = np.where(is_churned, (end_dates - start_dates).astype(np.int64), -1)
+        n_months = (end_dates - start_dates).astype(np.int64) // MRR_MONTH_DAYS
+        month_ptr = np.zeros(len(customers) + 1, dtype=np.int64)
+        np.cumsum(n_months, out=month_ptr[1:])
+        total_months = int(month_ptr[-1])
+
+        exp_range = a.expansion_percentage_range
+        con_range = a.contraction_percentage_range
+        (n, cust_idx, offsets, type_codes, amounts,
+         prev_mrrs, new_mrrs, current_mrrs) = _simulate_mrr(
+            initial_mrrs, month_ptr, churn_offsets,
+            a.monthly_expansion_probability, a.monthly_contraction_probability,
+            self.rng.random((total_months, 2)),
+            self.rng.triangular(
+                exp_range['min'], exp_range['median'], exp_range['max'], total_months
+            ),
+            self.rng.triangular(
+                con_range['min'], con_range['median'], con_range['max'], total_months
+            )
+        )
+        cust_idx = cust_idx[:n]
+
+        customer_ids = np.array([c['customer_id'] for c in customers], dtype=object)
+        self.mrr_movements = {
+            'movement_id': _sequential_ids('MRR', n).tolist(),
+            'customer_id': customer_ids[cust_idx].tolist(),
+            'movement_date': (start_dates[cust_idx] + offsets[:n]).tolist(),
+            'movement_type': np.array(MRR_MOVEMENT_TYPES, dtype=object)[type_codes[:n]].tolist(),
+            'amount': np.round(amounts[:n], 2).tolist(),
+            'previous_mrr': np.round(prev_mrrs[:n], 2).tolist(),
+            'new_mrr': np.round(new_mrrs[:n], 2).tolist(),
+        }
 
-            # Simulate monthly expansion/contraction
-            start = customer['start_date']
-            end = customer['churn_date'] if customer['churn_date'] else DATA_END_DATE
-
-            current_date = start + timedelta(days=30)
-            while current_date <= end:
-                previous_mrr = current_mrr
-
-                # Check for expansion
-                if random.random() < a.monthly_expansion_probability:
-                    expansion_pct = np.random.triangular(
-                        a.expansion_percentage_range['min'],
-                        a.expansion_percentage_range['median'],
-                        a.expansion_percentage_range['max']
-                    )
-                    expansion_amount = current_mrr * expansion_pct
-                    current_mrr += expansion_amount
-
-                    self.mrr_movements.append({
-                        'movement_id': f'MRR_{uuid.uuid4().hex[:8].upper()}',
-                        'customer_id': customer_id,
-                        'movement_date': current_date,
-                        'movement_type': 'Expansion',
-                        'amount': round(expansion_amount, 2),
-                        'previous_mrr': round(previous_mrr, 2),
-                        'new_mrr': round(current_mrr, 2)
-                    })
-
-                # Check for contraction
-                elif random.random() < a.monthly_contraction_probability:
-                    contraction_pct = np.random.triangular(
-                        a.contraction_percentage_range['min'],
-                        a.contraction_percentage_range['median'],
-                        a.contraction_percentage_range['max']
-                    )
-                    contraction_amount = current_mrr * contraction_pct
-                    current_mrr -= contraction_amount
-
-                    self.mrr_movements.append({
-                        'movement_id': f'MRR_{uuid.uuid4().hex[:8].upper()}',
-                        'customer_id': customer_id,
-                        'movement_date': current_date,
-                        'movement_type': 'Contraction',
-                        'amount': round(-contraction_amount, 2),
-                        'previous_mrr': round(previous_mrr, 2),
-                        'new_mrr': round(current_mrr, 2)
-                    })
-
-                current_date += timedelta(days=30)
-
-            # Churn movement if applicable
-            if customer['status'] == 'Churned' and customer['churn_date']:
-                self.mrr_movements.append({
-                    'movement_id': f'MRR_{uuid.uuid4().hex[:8].upper()}',
-                    'customer_id': customer_id,
-                    'movement_date': customer['churn_date'],
-                    'movement_type': 'Churn',
-                    'amount': round(-current_mrr, 2),
-                    'previous_mrr': round(current_mrr, 2),
-                    'new_mrr': 0
-                })
-            else:
-                # Update customer's current MRR
-                customer['current_mrr'] = round(current_mrr, 2)
+        # Update customers' current MRR (0 for churned customers)
+        for customer, current_mrr in zip(customers, np.round(current_mrrs, 2).tolist()):
+            customer['current_mrr'] = current_mrr
 
     def _generate_nps_surveys(self):
         """Generate NPS survey responses."""
-        a = self.assumptions.nps
+        results = self._map_customers(_nps_for_customer, self.customers)
 
-        for customer in self.customers:
-            customer_id = customer['customer_id']
-            start = customer['start_date']
-            end = customer['churn_date'] if customer['churn_date'] else DATA_END_DATE
-            is_churning = customer['status'] == 'Churned'
-
-            # Survey every 90 days
-            survey_date = start + timedelta(days=a.survey_frequency_days)
-
-            while survey_date <= end:
-                # Determine customer health for this survey
-                if is_churning and customer['churn_date']:
-                    days_to_churn = (customer['churn_date'] - survey_date).days
-                    if days_to_churn < 30:
-                        health = 'churning'
-                    elif days_to_churn < 90:
-                        health = 'at_risk'
-                    else:
-                        health = 'healthy'
-                else:
-                    health = 'healthy'
-
-                responded = random.random() < a.response_rate
-                score = None
-                response_text = None
-
-                if responded:
-                    # Determine NPS category based on health
-                    dist = a.score_distribution_by_health[health]
-                    category = np.random.choice(
-                        ['promoter', 'passive', 'detractor'],
-                        p=dist
-                    )
-
-                    if category == 'promoter':
-                        score = random.choice([9, 10])
-                        response_text = random.choice([
-                            "Great product, very helpful for our team!",
-                            "Love the features, would recommend.",
-                            "Excellent support and product quality.",
-                            None
-                        ])
-                    elif category == 'passive':
-                        score = random.choice([7, 8])
-                        response_text = random.choice([
-                            "Good product but room for improvement.",
-                            "Works well for basic needs.",
-                            None
-                        ])
-                    else:  # detractor
-                        score = random.randint(0, 6)
-                        response_text = random.choice([
-                            "Too expensive for what we get.",
-                            "Missing key features we need.",
-                            "Support response times are slow.",
-                            "Difficult to use, needs better UX.",
-                            None
-                        ])
-
-                self.nps_surveys.append({
-                    'survey_id': f'NPS_{uuid.uuid4().hex[:8].upper()}',
-                    'customer_id': customer_id,
-                    'survey_date': survey_date,
-                    'score': score,
-                    'response_text': response_text,
-                    'responded': responded
-                })
-
-                # Update customer's latest NPS if responded
-                if responded and score is not None:
-                    customer['latest_nps_score'] = score
-
-                survey_date += timedelta(days=a.survey_frequency_days)
+        for customer, (surveys, latest_score) in zip(self.customers, results):
+            _extend_columns(self.nps_surveys, surveys)
+            # Update customer's latest NPS if responded
+            if latest_score is not None:
+                customer['latest_nps_score'] = latest_score
 
     def _generate_expansion_opportunities(self):
         """Generate expansion/upsell opportunities."""
-        a = self.assumptions.expansion
-
-        for customer in self.customers:
-            if customer['status'] != 'Active':
-                continue
-
-            customer_id = customer['customer_id']
-            current_mrr = customer['current_mrr']
-            start = customer['start_date']
-
-            # Check for expansion opportunities every 30 days
-            check_date = start + timedelta(days=90)  # Start checking after 90 days
-
-            while check_date <= DATA_END_DATE:
-                if random.random() < a.monthly_expansion_probability:
-                    # Create expansion opportunity
-                    estimated_value = current_mrr * np.random.triangular(
-                        a.expansion_percentage_range['min'] * 12,
-                        a.expansion_percentage_range['median'] * 12,
-                        a.expansion_percentage_range['max'] * 12
-                    )
-
-                    # Determine status based on time
-                    days_since_identified = (DATA_END_DATE - check_date).days
-
-                    if days_since_identified < 30:
-                        status = 'Identified'
-                        closed_date = None
-                        actual_value = None
-                    elif days_since_identified < 60:
-                        status = 'In Progress'
-                        closed_date = None
-                        actual_value = None
-                    else:
-                        # Resolve the opportunity
-                        if random.random() < a.expansion_conversion_rate:
-                            status = 'Won'
-                            actual_value = estimated_value * np.random.uniform(0.8, 1.2)
-                        else:
-                            status = 'Lost'
-                            actual_value = None
-                        closed_date = check_date + timedelta(days=random.randint(30, 90))
-                        if closed_date > DATA_END_DATE:
-                            closed_date = DATA_END_DATE
-
-                    self.expansion_opportunities.append({
-                        'expansion_id': f'EXP_{uuid.uuid4().hex[:8].upper()}',
-                        'customer_id': customer_id,
-                        'identified_date': check_date,
-                        'opportunity_type': random.choice(['Upsell', 'Cross-sell']),
-                        'estimated_value': round(estimated_value, 2),
-                        'status': status,
-                        'closed_date': closed_date,
-                        'actual_value': round(actual_value, 2) if actual_value else None
-                    })
-
-                check_date += timedelta(days=30)
+        active = [c for c in self.customers if c['status'] == 'Active']
+        for opportunities in self._map_customers(_expansion_for_customer, active):
+            _extend_columns(self.expansion_opportunities, opportunities)
 
     def _update_customer_health_scores(self):
         """Calculate health scores for active customers."""
+        active = [c for c in self.customers if c['status'] == 'Active']
         for customer in self.customers:
             if customer['status'] != 'Active':
                 customer['health_score'] = None
                 customer['churn_probability'] = None
-                continue
-
-            customer_id = customer['customer_id']
-
-            # Get recent usage
-            customer_usage = [u for u in self.usage_events
-                           if u['customer_id'] == customer_id]
-
-            if not customer_usage:
-                customer['health_score'] = 'Yellow'
-                customer['churn_probability'] = 0.5
-                continue
-
-            # Sort by date and get last 30 days
-            customer_usage.sort(key=lambda x: x['event_date'], reverse=True)
-            recent_usage = customer_usage[:30]
-
-            # Calculate usage score (0-100)
-            avg_logins = np.mean([u['logins'] for u in recent_usage])
-            avg_api_calls = np.mean([u['api_calls'] for u in recent_usage])
-
-            # Normalize based on segment
-            segment = customer['company_size']
-            base = self.assumptions.usage.base_usage_by_segment.get(segment, {})
-            expected_logins = base.get('logins', 5)
-            expected_api = base.get('api_calls', 100)
-
-            login_score = min(100, (avg_logins / expected_logins) * 50)
-            api_score = min(100, (avg_api_calls / expected_api) * 50)
-            usage_score = (login_score + api_score) / 2
-
-            # Get NPS score
-            nps = customer.get('latest_nps_score')
-            nps_score = 0
-            if nps is not None:
-                if nps >= 9:
-                    nps_score = 100
-                elif nps >= 7:
-                    nps_score = 60
-                else:
-                    nps_score = 20
-
-            # Calculate tenure factor (longer tenure = more stable)
-            tenure_days = (DATA_END_DATE - customer['start_date']).days
-            tenure_score = min(100, tenure_days / 3)  # Max score at 300 days
-
-            # Composite health score
-            # Usage: 40%, NPS: 30%, Tenure: 30%
-            health_value = usage_score * 0.4 + nps_score * 0.3 + tenure_score * 0.3
-
-            # Determine health category
-            if health_value >= 70:
-                health_score = 'Green'
-                churn_prob = np.random.uniform(0.05, 0.15)
-            elif health_value >= 40:
-                health_score = 'Yellow'
-                churn_prob = np.random.uniform(0.25, 0.45)
-            else:
-                health_score = 'Red'
-                churn_prob = np.random.uniform(0.55, 0.85)
+        if not active:
+            return
+
+        # Average usage over each customer's most recent 30 days of events,
+        # aggregated by DuckDB straight from the spooled Parquet file so the
+        # usage table is never materialized as a DataFrame
+        self.usage_events.close()
+        with duckdb.connect() as conn:
+            recent = conn.execute("""
+                SELECT customer_id, AVG(logins) AS logins, AVG(api_calls) AS api_calls
+                FROM (
+                    SELECT customer_id, logins, api_calls
+                    FROM read_parquet(?)
+                    QUALIFY ROW_NUMBER() OVER (
+                        PARTITION BY customer_id ORDER BY event_date DESC
+                    ) <= ?
+                )
+                GROUP BY customer_id
+            """, [self.usage_events.path, HEALTH_RECENT_DAYS]).df().set_index('customer_id')
+
+        cust_df = pd.DataFrame({
+            'customer_id': [c['customer_id'] for c in active],
+            'company_size': [c['company_size'] for c in active],
+        })
+        cust_df = cust_df.join(recent, on='customer_id')
+        has_usage = cust_df['logins'].notna().to_numpy()
+
+        # Expected usage per customer based on segment
+        base_usage = self.assumptions.usage.base_usage_by_segment
+        expected_logins = cust_df['company_size'].map(
+            {segment: base.get('logins', 5) for segment, base in base_usage.items()}
+        ).fillna(5)
+        expected_api = cust_df['company_size'].map(
+            {segment: base.get('api_calls', 100) for segment, base in base_usage.items()}
+        ).fillna(100)
+        nps = np.array(
+            [-1 if c['latest_nps_score'] is None else c['latest_nps_score'] for c in active],
+            dtype=np.int64
+        )
+        start_dates = np.array([c['start_date'] for c in active], dtype='datetime64[D]')
+        tenure_days = (np.datetime64(DATA_END_DATE, 'D') - start_dates).astype(np.int64)
+
+        # One draw per customer with usage, in customer order
+        draws = np.full(len(active), np.nan)
+        draws[has_usage] = self.rng.random(int(has_usage.sum()))
+
+        categories, churn_prob = _score_health(
+            cust_df['logins'].to_numpy(np.float64),
+            cust_df['api_calls'].to_numpy(np.float64),
+            expected_logins.to_numpy(np.float64),
+            expected_api.to_numpy(np.float64),
+            nps,
+            tenure_days,
+            draws
+        )
 
+        health_scores = np.array(HEALTH_CATEGORIES, dtype=object)[categories]
+        for customer, health_score, prob in zip(
+            active, health_scores.tolist(), np.round(churn_prob, 3).tolist()
+        ):
             customer['health_score'] = health_score
-            customer['churn_probability'] = round(churn_prob, 3)
+            customer['churn_probability'] = prob
 
     def _print_summary(self):
         """Print data generation summary."""
         print("\n" + "=" * 50)
         print("DATA GENERATION SUMMARY")
         print("=" * 50)
-        print(f"  Leads:                  {len(self.leads):,}")
+        print(f"  Leads:                  {_row_count(self.leads):,}")
         print(f"  Sales Reps:             {len(self.sales_reps):,}")
-        print(f"  Opportunities:          {len(self.opportunities):,}")
-        print(f"  Stage Transitions:      {len(self.stage_transitions):,}")
+        print(f"  Opportunities:          {_row_count(self.opportunities):,}")
+        print(f"  Stage Transitions:      {_row_count(self.stage_transitions):,}")
         print(f"  Customers:              {len(self.customers):,}")
         print(f"  Usage Events:           {len(self.usage_events):,}")
-        print(f"  Marketing Spend:        {len(self.marketing_spend):,}")
-        print(f"  MRR Movements:          {len(self.mrr_movements):,}")
-        print(f"  NPS Surveys:            {len(self.nps_surveys):,}")
-        print(f"  Expansion Opps:         {len(self.expansion_opportunities):,}")
+        print(f"  Marketing Spend:        {_row_count(self.marketing_spend):,}")
+        print(f"  MRR Movements:          {_row_count(self.mrr_movements):,}")
+        print(f"  NPS Surveys:            {_row_count(self.nps_surveys):,}")
+        print(f"  Expansion Opps:         {_row_count(self.expansion_opportunities):,}")
         print("=" * 50)
 
-        # Additional stats
-        won_deals = sum(1 for o in self.opportunities if o['is_won'])
-        total_closed = sum(1 for o in self.opportunities if o['is_won'] is not None)
+        # Additional stats, one pass per entity
+        won_deals = total_closed = 0
+        for won in self.opportunities['is_won']:
+            if won is not None:
+                total_closed += 1
+                won_deals += won
         win_rate = won_deals / total_closed if total_closed > 0 else 0
 
-        active_customers = sum(1 for c in self.customers if c['status'] == 'Active')
-        churned_customers = sum(1 for c in self.customers if c['status'] == 'Churned')
-
-        total_mrr = sum(c['current_mrr'] for c in self.customers if c['status'] == 'Active')
+        active_customers = churned_customers = 0
+        total_mrr = 0.0
+        for c in self.customers:
+            if c['status'] == 'Active':
+                active_customers += 1
+                total_mrr += c['current_mrr']
+            elif c['status'] == 'Churned':
+                churned_customers += 1
 
         print(f"\n  Win Rate:               {win_rate:.1%}")
         print(f"  Active Customers:       {active_customers:,}")
@@ -795,11 +1246,35 @@ class SyntheticDataGenerator:
             ('expansion_opportunities', self.expansion_opportunities),
         ]
 
-        for table_name, data in tables:
-            if data:
-                df = pd.DataFrame(data)
-                load_dataframe(table_name, df)
-                print(f"  Loaded {len(data):,} rows into {table_name}")
+        # Load every table in one transaction: a single commit instead of one
+        # per table, and a failed load leaves no partially filled database
+        with get_db() as conn:
+            conn.begin()
+            try:
+                for table_name, data in tables:
+                    n_rows = _row_count(data)
+                    if isinstance(data, _ParquetSpool):
+                        if n_rows:
+                            data.close()
+                            bulk_load_parquet(conn, table_name, data.path)
+                            print(f"  Loaded {n_rows:,} rows into {table_name}")
+                    elif n_rows:
+                        # Columnar stores map straight onto DataFrame columns
+                        if isinstance(data, dict):
+                            df = pd.DataFrame(data, copy=False)
+                        else:
+                            df = pd.DataFrame(data)
+                        if table_name == 'opportunities':
+                            # company_name is only carried for customer creation
+                            df = df.drop(columns='company_name')
+                        for col in CATEGORICAL_COLUMNS.intersection(df.columns):
+                            df[col] = df[col].astype('category')
+                        bulk_load(conn, table_name, df)
+                        print(f"  Loaded {n_rows:,} rows into {table_name}")
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
 
         print("Database save complete!")
 
@@ -4,9 +4,12 @@ Pydantic Models for Data Schema
 
 Defines all data models for the SaaS Revenue Lifecycle Analyzer.
 These models are used for:
-- Data validation during generation
 - API request/response serialization
 - Database schema documentation
+
+The synthetic data generator does not instantiate them: it accumulates
+plain records and columnar stores and bulk-loads them into the database,
+so per-row validation cost stays out of the generation path.
 """
 
 from datetime import date, datetime
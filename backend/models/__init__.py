@@ -18,6 +18,8 @@ from .train import (
 
 from .predict import (
     ChurnPredictor,
+    Prediction,
+    get_predictor,
     get_predictions_for_segment,
     get_high_risk_customers,
 )
@@ -38,6 +40,8 @@ __all__ = [
     'MODEL_DIR',
     # Prediction
     'ChurnPredictor',
+    'Prediction',
+    'get_predictor',
     'get_predictions_for_segment',
     'get_high_risk_customers',
     # Calibration
@@ -18,7 +18,6 @@ import numpy as np
 from sklearn.calibration import CalibratedClassifierCV, calibration_curve
 from sklearn.metrics import brier_score_loss, log_loss
 
-from data.database import query_to_df
 from .train import ChurnModelTrainer, MODEL_DIR
 
 
@@ -44,14 +43,13 @@ class ModelCalibrator:
         df = self.trainer.prepare_features()
         df = self.trainer.encode_categorical(df, fit=False)
 
-        feature_cols = self.trainer.get_feature_columns()
-        available = [f for f in feature_cols if f in df.columns]
+        available = self.trainer.get_available_features(df)
 
         X = df[available].fillna(0)
         y = df['churned']
 
-        # Scale features
-        X_scaled = self.trainer.scaler.transform(X)
+        # Scale features; tree models split on float32, so predict on float32 too
+        X_scaled = self.trainer.scaler.transform(X).astype(np.float32, copy=False)
 
         # Calibrate using cross-validation
         self.calibrated_model = CalibratedClassifierCV(
@@ -106,17 +104,23 @@ class ModelCalibrator:
         n_bins: int = 10
     ) -> float:
         """Calculate Expected Calibration Error (ECE)."""
+        y_prob = np.asarray(y_prob, dtype=np.float64)
+        if len(y_prob) == 0:
+            return 0.0
         bin_boundaries = np.linspace(0, 1, n_bins + 1)
-        ece = 0
 
-        for i in range(n_bins):
-            in_bin = (y_prob >= bin_boundaries[i]) & (y_prob < bin_boundaries[i + 1])
-            prop_in_bin = in_bin.mean()
+        # Bin i holds probabilities in [boundary_i, boundary_i+1)
+        bin_idx = np.digitize(y_prob, bin_boundaries) - 1
+        in_range = (bin_idx >= 0) & (bin_idx < n_bins)
+        bin_idx = bin_idx[in_range]
 
-            if prop_in_bin > 0:
-                avg_confidence = y_prob[in_bin].mean()
-                avg_accuracy = y_true[in_bin].mean()
-                ece += np.abs(avg_accuracy - avg_confidence) * prop_in_bin
+        # Per-bin sums of confidence and accuracy; each bin contributes
+        # |avg_accuracy - avg_confidence| * count / N = |acc_sum - conf_sum| / N
+        conf_sum = np.bincount(bin_idx, weights=y_prob[in_range], minlength=n_bins)
+        acc_sum = np.bincount(
+            bin_idx, weights=np.asarray(y_true, dtype=np.float64)[in_range], minlength=n_bins
+        )
+        ece = np.abs(acc_sum - conf_sum).sum() / len(y_prob)
 
         return float(ece)
 
@@ -189,57 +193,76 @@ def find_optimal_threshold(
     df = trainer.prepare_features()
     df = trainer.encode_categorical(df, fit=False)
 
-    feature_cols = trainer.get_feature_columns()
-    available = [f for f in feature_cols if f in df.columns]
+    available = trainer.get_available_features(df)
 
     X = df[available].fillna(0)
     y = df['churned']
     mrr = df['current_mrr'].fillna(df['initial_mrr'])
 
-    X_scaled = trainer.scaler.transform(X)
+    X_scaled = trainer.scaler.transform(X).astype(np.float32, copy=False)
     y_prob = trainer.model.predict_proba(X_scaled)[:, 1]
 
     # Test different thresholds
     thresholds = np.arange(0.1, 0.9, 0.05)
-    results = []
-
-    for threshold in thresholds:
-        y_pred = (y_prob >= threshold).astype(int)
-
-        # Calculate confusion matrix components
-        tp = ((y_pred == 1) & (y == 1)).sum()
-        fp = ((y_pred == 1) & (y == 0)).sum()
-        fn = ((y_pred == 0) & (y == 1)).sum()
-        tn = ((y_pred == 0) & (y == 0)).sum()
-
-        # Calculate business value
-        # Value from saving churners
-        saved_value = tp * mrr[y == 1].mean() * 12 * intervention_effectiveness if tp > 0 else 0
-
-        # Cost of interventions (both successful and unsuccessful)
-        intervention_cost = (tp + fp) * cost_fp
-
-        # Cost of missed churners
-        missed_cost = fn * cost_fn
-
-        net_value = saved_value - intervention_cost - missed_cost
 
-        results.append({
-            'threshold': float(threshold),
-            'precision': tp / (tp + fp) if (tp + fp) > 0 else 0,
-            'recall': tp / (tp + fn) if (tp + fn) > 0 else 0,
-            'tp': int(tp),
-            'fp': int(fp),
-            'fn': int(fn),
-            'tn': int(tn),
-            'saved_value': float(saved_value),
-            'intervention_cost': float(intervention_cost),
-            'missed_cost': float(missed_cost),
-            'net_value': float(net_value)
-        })
+    # Sort once; the customers predicted positive at a threshold are the
+    # suffix of the sorted probabilities at or above it
+    y_true = y.to_numpy()
+    order = np.argsort(y_prob, kind='stable')
+    sorted_prob = np.asarray(y_prob, dtype=np.float64)[order]
+    positives_below = np.concatenate(([0], np.cumsum(y_true[order] == 1)))
+    n_positive = int(positives_below[-1])
+
+    # Calculate confusion matrix components for every threshold
+    k = np.searchsorted(sorted_prob, thresholds, side='left')
+    tp = n_positive - positives_below[k]
+    fp = (len(sorted_prob) - k) - tp
+    fn = n_positive - tp
+    tn = k - positives_below[k]
+
+    # Calculate business value
+    # Value from saving churners
+    churner_mrr = mrr[y == 1].mean() if n_positive > 0 else 0
+    saved_value = tp * churner_mrr * 12 * intervention_effectiveness
+
+    # Cost of interventions (both successful and unsuccessful)
+    intervention_cost = (tp + fp) * cost_fp
+
+    # Cost of missed churners
+    missed_cost = fn * cost_fn
+
+    net_value = saved_value - intervention_cost - missed_cost
+
+    flagged = tp + fp
+    precision = np.divide(tp, flagged, out=np.zeros(len(thresholds)), where=flagged > 0)
+    recall = np.divide(tp, n_positive, out=np.zeros(len(thresholds)), where=n_positive > 0)
+
+    results = [
+        {
+            'threshold': threshold,
+            'precision': p,
+            'recall': r,
+            'tp': t_p,
+            'fp': f_p,
+            'fn': f_n,
+            'tn': t_n,
+            'saved_value': saved,
+            'intervention_cost': cost,
+            'missed_cost': missed,
+            'net_value': net
+        }
+        for threshold, p, r, t_p, f_p, f_n, t_n, saved, cost, missed, net in zip(
+            thresholds.tolist(), precision.tolist(), recall.tolist(),
+            tp.tolist(), fp.tolist(), fn.tolist(), tn.tolist(),
+            np.asarray(saved_value, dtype=np.float64).tolist(),
+            np.asarray(intervention_cost, dtype=np.float64).tolist(),
+            np.asarray(missed_cost, dtype=np.float64).tolist(),
+            np.asarray(net_value, dtype=np.float64).tolist()
+        )
+    ]
 
     # Find optimal threshold
-    optimal = max(results, key=lambda x: x['net_value'])
+    optimal = results[int(np.argmax(net_value))]
 
     return {
         'optimal_threshold': optimal['threshold'],
@@ -288,13 +311,12 @@ def get_reliability_diagram_data() -> Dict[str, Any]:
         df = calibrator.trainer.prepare_features()
         df = calibrator.trainer.encode_categorical(df, fit=False)
 
-        feature_cols = calibrator.trainer.get_feature_columns()
-        available = [f for f in feature_cols if f in df.columns]
+        available = calibrator.trainer.get_available_features(df)
 
         X = df[available].fillna(0)
         y = df['churned']
 
-        X_scaled = calibrator.trainer.scaler.transform(X)
+        X_scaled = calibrator.trainer.scaler.transform(X).astype(np.float32, copy=False)
         y_prob = calibrator.trainer.model.predict_proba(X_scaled)[:, 1]
 
         fraction_of_positives, mean_predicted_value = calibration_curve(
@@ -330,49 +352,44 @@ def calculate_prediction_intervals(
     results = []
     n_bootstrap = 100
 
-    for customer_id in customer_ids:
-        # Get features
-        query = f"""
-            SELECT * FROM customers
-            WHERE customer_id = '{customer_id}'
-        """
-        df = query_to_df(query)
+    # Prepare features once and pick out the requested customers
+    df = trainer.prepare_features()
+    df = df[df['customer_id'].isin(customer_ids)].copy()
 
-        if df.empty:
-            continue
+    if df.empty:
+        return results
 
-        # Get prediction
-        df = trainer.prepare_features()
-        customer_df = df[df['customer_id'] == customer_id]
+    df = trainer.encode_categorical(df, fit=False)
 
-        if customer_df.empty:
-            continue
+    available = trainer.get_available_features(df)
 
-        customer_df = trainer.encode_categorical(customer_df, fit=False)
+    X_scaled = trainer.scaler.transform(df[available].fillna(0)).astype(np.float32, copy=False)
+    row_index = {cid: i for i, cid in enumerate(df['customer_id'])}
 
-        feature_cols = trainer.get_feature_columns()
-        available = [f for f in feature_cols if f in customer_df.columns]
+    lower_pct = (1 - confidence) / 2 * 100
+    upper_pct = (1 + confidence) / 2 * 100
 
-        X = customer_df[available].fillna(0)
-        X_scaled = trainer.scaler.transform(X)
+    found_ids = [cid for cid in customer_ids if cid in row_index]
+    X = X_scaled[[row_index[cid] for cid in found_ids]]
 
-        # Bootstrap predictions
-        predictions = []
-        for _ in range(n_bootstrap):
-            # Add small noise to features
-            X_noisy = X_scaled + np.random.normal(0, 0.1, X_scaled.shape)
-            pred = trainer.model.predict_proba(X_noisy)[0, 1]
-            predictions.append(pred)
+    # Bootstrap predictions: add small noise to n_bootstrap copies of every
+    # customer's features and score them all in one batch
+    rng = np.random.default_rng()
+    X_boot = np.repeat(X, n_bootstrap, axis=0)
+    X_boot += 0.1 * rng.standard_normal(X_boot.shape, dtype=np.float32)
+    predictions = trainer.model.predict_proba(X_boot)[:, 1].reshape(len(X), n_bootstrap)
 
-        predictions = np.array(predictions)
-        lower_pct = (1 - confidence) / 2 * 100
-        upper_pct = (1 + confidence) / 2 * 100
+    point_estimates = trainer.model.predict_proba(X)[:, 1]
+    lower_bounds, upper_bounds = np.percentile(predictions, [lower_pct, upper_pct], axis=1)
 
+    for customer_id, point, lower, upper in zip(
+        found_ids, point_estimates.tolist(), lower_bounds.tolist(), upper_bounds.tolist()
+    ):
         results.append({
             'customer_id': customer_id,
-            'point_estimate': float(trainer.model.predict_proba(X_scaled)[0, 1]),
-            'lower_bound': float(np.percentile(predictions, lower_pct)),
-            'upper_bound': float(np.percentile(predictions, upper_pct)),
+            'point_estimate': point,
+            'lower_bound': lower,
+            'upper_bound': upper,
             'confidence_level': confidence
         })
 
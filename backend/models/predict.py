@@ -9,7 +9,11 @@ Provides inference capabilities for churn prediction:
 - Threshold optimization
 """
 
-import pickle
+import functools
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
@@ -22,14 +26,129 @@ try:
 except ImportError:
     HAS_SHAP = False
 
-from data.database import query_to_df
-from .train import ChurnModelTrainer, MODEL_DIR
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit; kernels run as plain Python."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+from data.database import query_to_df, get_data_version
+from .train import ChurnModelTrainer, MODEL_DIR, NPS_CATEGORY_BINS, NPS_CATEGORIES
+
+
+# Risk levels and confidence levels in code order, as returned by
+# _bucketize; recommended actions are indexed by risk code
+RISK_LEVELS = ('Low', 'Medium', 'High', 'Critical')
+CONFIDENCE_LEVELS = ('Low', 'Medium', 'High')
+RECOMMENDED_ACTIONS = (
+    "Continue standard engagement",
+    "Proactive check-in recommended",
+    "Schedule urgent customer success call",
+    "Immediate executive outreach required",
+)
+
+
+# Explanation modes for predict_batch, and the churn probability above
+# which 'top' computes SHAP values
+EXPLAIN_MODES = ('top', 'all', 'none')
+SHAP_MIN_PROBABILITY = 0.3
+
+# predict_single result cache: entries are keyed on the data version and
+# expire after PREDICTION_CACHE_TTL seconds
+PREDICTION_CACHE_SIZE = 10_000
+PREDICTION_CACHE_TTL = 300
+
+# How far below the requested threshold a customer's stored churn
+# probability may be and still be scored by get_high_risk_customers
+PRESCREEN_MARGIN = 0.2
+
+# Readable names for model features, used in explanations
+FEATURE_DISPLAY_NAMES = {
+    'tenure_days': 'Account Tenure',
+    'initial_mrr': 'Initial MRR',
+    'current_mrr': 'Current MRR',
+    'avg_logins': 'Average Logins',
+    'avg_api_calls': 'API Usage',
+    'avg_reports': 'Report Generation',
+    'avg_team_active': 'Active Team Size',
+    'std_logins': 'Login Consistency',
+    'usage_trend': 'Usage Trend',
+    'mrr_change': 'Revenue Change',
+    'expansion_count': 'Expansions',
+    'contraction_count': 'Contractions',
+    'latest_nps_score': 'NPS Score',
+    'company_size_encoded': 'Company Size',
+    'industry_encoded': 'Industry',
+    'channel_encoded': 'Acquisition Channel',
+    'nps_category_encoded': 'NPS Category'
+}
+
+
+# Customer ID format; \Z rather than $ so a trailing newline is rejected
+_CUST_ID_RE = re.compile(r'^CUST_[A-Z0-9]{8}\Z')
+
+
+@dataclass(slots=True)
+class Prediction:
+    """Churn prediction for one customer; converted to a dict at the API boundary."""
+
+    customer_id: str
+    churn_probability: float
+    risk_level: str
+    confidence: str
+    explanation: List[Dict[str, Any]] = field(default_factory=list)
+    top_risk_factors: list = field(default_factory=list)
+    recommended_action: str = ''
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form, as returned by the API."""
+        return asdict(self)
+
+
+@njit(cache=True, parallel=True)
+def _bucketize(probs):
+    """
+    Risk and confidence codes for an array of churn probabilities.
+
+    Applies the thresholds of ChurnPredictor._get_risk_level and
+    _get_confidence to every probability at once.
+    """
+    n = probs.shape[0]
+    risk = np.empty(n, np.int8)
+    confidence = np.empty(n, np.int8)
+
+    for i in prange(n):
+        p = probs[i]
+        if p >= 0.7:
+            risk[i] = 3
+        elif p >= 0.5:
+            risk[i] = 2
+        elif p >= 0.3:
+            risk[i] = 1
+        else:
+            risk[i] = 0
+
+        # Confidence is higher when probability is extreme
+        if p < 0.15 or p > 0.85:
+            confidence[i] = 2
+        elif p < 0.3 or p > 0.7:
+            confidence[i] = 1
+        else:
+            confidence[i] = 0
+
+    return risk, confidence
 
 
 def validate_customer_id(customer_id: str) -> bool:
     """Validate customer ID format to prevent SQL injection."""
-    pattern = r'^CUST_[A-Z0-9]{8}$'
-    return bool(re.match(pattern, customer_id))
+    return _CUST_ID_RE.match(customer_id) is not None
 
 
 def validate_segment(segment: str, segment_value: str) -> tuple:
@@ -60,127 +179,328 @@ class ChurnPredictor:
         self.model_loaded = self.trainer.load_model()
         self.explainer = None
 
+        # The predictor is shared; not every estimator's predict_proba (nor
+        # the SHAP explainer) is safe to call concurrently, so every call
+        # into either holds this lock
+        self._predict_lock = threading.Lock()
+
+        # (customer_id, data version) -> (prediction, expiry), oldest first.
+        # The cache lives on the predictor, so retraining (which replaces
+        # the shared predictor) starts from an empty cache
+        self._prediction_cache: OrderedDict[
+            Tuple[str, int], Tuple[Dict[str, Any], float]
+        ] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Model feature columns, in the order the scaler was fitted on
+        self._feature_cols = tuple(self.trainer.get_feature_columns())
+
+        # Category -> code lookups per encoded column; unseen categories
+        # encode as -1, as in ChurnModelTrainer.encode_categorical
+        self._encoder_maps = {
+            col: {cls: code for code, cls in enumerate(categories.tolist())}
+            for col, categories in self.trainer.label_encoders.items()
+        }
+
         if self.model_loaded and HAS_SHAP:
             try:
                 self.explainer = shap.TreeExplainer(self.trainer.model)
-            except:
+            except Exception:
                 pass
 
+    @classmethod
+    def invalidate(cls):
+        """Drop the shared predictor so the next get_predictor() reloads the model."""
+        get_predictor.cache_clear()
+
     def predict_single(self, customer_id: str) -> Dict[str, Any]:
         """
         Get churn prediction for a single customer.
 
-        Returns probability, risk level, and explanation.
+        Returns probability, risk level, and explanation. Results are cached
+        until the data changes or PREDICTION_CACHE_TTL seconds pass.
         """
         # Validate customer ID
         if not validate_customer_id(customer_id):
             return {'error': 'Invalid customer ID format'}
 
+        key = (customer_id, get_data_version())
+        result = self._get_cached_prediction(key)
+        if result is None:
+            result = self._predict_single(customer_id)
+            if 'error' not in result:
+                self._cache_prediction(key, result)
+        return result
+
+    def _get_cached_prediction(self, key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+        """Cached prediction for key, or None if missing or expired."""
+        with self._cache_lock:
+            entry = self._prediction_cache.get(key)
+            if entry is None:
+                return None
+
+            result, expiry = entry
+            if time.time() > expiry:
+                del self._prediction_cache[key]
+                return None
+
+            self._prediction_cache.move_to_end(key)
+            return result
+
+    def _cache_prediction(self, key: Tuple[str, int], result: Dict[str, Any]):
+        """Store a prediction, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            cache = self._prediction_cache
+            if len(cache) >= PREDICTION_CACHE_SIZE and key not in cache:
+                cache.popitem(last=False)
+
+            self._prediction_cache[key] = (result, time.time() + PREDICTION_CACHE_TTL)
+            self._prediction_cache.move_to_end(key)
+
+    def _predict_single(self, customer_id: str) -> Dict[str, Any]:
+        """Uncached prediction for a validated customer ID."""
         if not self.model_loaded:
             return self._fallback_prediction(customer_id)
 
         # Get customer features
-        features = self._get_customer_features(customer_id)
+        features = self._get_customer_features([customer_id])
 
-        if features is None:
+        if features.empty:
             return {'error': 'Customer not found'}
 
         # Prepare feature vector
         X = self._prepare_features(features)
 
         # Get prediction
-        proba = self.trainer.model.predict_proba(X)[0, 1]
-
-        # Get explanation
-        explanation = self._explain_prediction(X, features)
-
-        # Determine risk level
-        risk_level = self._get_risk_level(proba)
-
-        return {
-            'customer_id': customer_id,
-            'churn_probability': float(proba),
-            'risk_level': risk_level,
-            'confidence': self._get_confidence(proba),
-            'explanation': explanation,
-            'top_risk_factors': explanation[:3] if explanation else [],
-            'recommended_action': self._get_recommended_action(proba, explanation)
-        }
+        with self._predict_lock:
+            proba = self.trainer.model.predict_proba(X)[0, 1]
+
+        # Get explanation; to_dict() turns the row's numpy scalars into
+        # plain Python values, which the API can serialize
+        explanation = self._explain_prediction(X, features.iloc[0].to_dict())
 
-    def predict_batch(self, customer_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return self._build_prediction(
+            customer_id, proba, explanation,
+            self._get_risk_level(proba),
+            self._get_confidence(proba),
+            self._get_recommended_action(proba, explanation)
+        ).to_dict()
+
+    def predict_batch(
+        self,
+        customer_ids: Optional[List[str]] = None,
+        explain: str = 'top'
+    ) -> List[Dict[str, Any]]:
         """
         Get churn predictions for multiple customers.
 
-        If customer_ids is None, predicts for all active customers.
+        If customer_ids is None, predicts for all active customers. Features
+        for all customers are fetched, encoded and scored in one pass;
+        customers that cannot be scored get an error entry at the end.
+        Without a model, rule-based fallback scores also come from one query.
+
+        explain selects which customers get SHAP explanations: 'top' only
+        those above SHAP_MIN_PROBABILITY, 'all' every customer, 'none'
+        nobody. The rest get rule-based explanations.
+        """
+        predictions, errors = self.score_batch(customer_ids, explain)
+        return [p.to_dict() for p in predictions] + errors
+
+    def score_batch(
+        self,
+        customer_ids: Optional[List[str]] = None,
+        explain: str = 'top'
+    ) -> Tuple[List[Prediction], List[Dict[str, Any]]]:
+        """
+        Score customers as in predict_batch, keeping Prediction objects.
+
+        Returns the predictions in descending probability order and, as a
+        separate list, an error dict for every customer that could not be
+        scored. For callers that filter or slice before converting to dicts.
         """
+        if explain not in EXPLAIN_MODES:
+            raise ValueError(f"Invalid explain mode. Must be one of: {', '.join(EXPLAIN_MODES)}")
+
         if customer_ids is None:
             query = "SELECT customer_id FROM customers WHERE status = 'Active'"
             df = query_to_df(query)
             customer_ids = df['customer_id'].tolist()
 
-        results = []
+        valid_ids = [cid for cid in customer_ids if validate_customer_id(cid)]
+
+        if not self.model_loaded:
+            results = self._fallback_predictions(valid_ids)
+            results.sort(key=lambda x: x.churn_probability, reverse=True)
+            found = {r.customer_id for r in results}
+        else:
+            features = self._get_customer_features(valid_ids)
+
+            results = []
+            if not features.empty:
+                X = self._prepare_features(features)
+                with self._predict_lock:
+                    probas = self.trainer.model.predict_proba(X)[:, 1]
+                risk_codes, confidence_codes = _bucketize(probas.astype(np.float64))
+
+                # One SHAP call for the rows that need it, sliced per customer;
+                # shap_pos maps a row to its SHAP row, -1 for rule-based
+                if explain == 'all':
+                    shap_idx = np.arange(len(probas))
+                elif explain == 'top':
+                    shap_idx = np.flatnonzero(probas > SHAP_MIN_PROBABILITY)
+                else:
+                    shap_idx = np.empty(0, dtype=np.intp)
+                shap_values = self._shap_values(X[shap_idx]) if shap_idx.size else None
+                shap_pos = np.full(len(probas), -1, dtype=np.intp)
+                shap_pos[shap_idx] = np.arange(shap_idx.size)
+                feature_names = self._explanation_names(features.columns)
+
+                # Emit results in descending probability order (ties keep input order)
+                customer_ids_arr = features['customer_id'].to_numpy()
+                rows = features.to_dict('records')
+                order = np.argsort(-probas, kind='stable')
+
+                for i in order.tolist():
+                    risk = int(risk_codes[i])
+                    pos = shap_pos[i]
+                    explanation = self._explain_from_shap_row(
+                        shap_values[pos] if shap_values is not None and pos >= 0 else None,
+                        rows[i], feature_names
+                    )
+                    results.append(self._build_prediction(
+                        customer_ids_arr[i], probas[i], explanation,
+                        RISK_LEVELS[risk], CONFIDENCE_LEVELS[confidence_codes[i]],
+                        RECOMMENDED_ACTIONS[risk]
+                    ))
+
+            found = set(features['customer_id'])
+
+        errors = []
         for cid in customer_ids:
-            pred = self.predict_single(cid)
-            results.append(pred)
+            if not validate_customer_id(cid):
+                errors.append({'error': 'Invalid customer ID format'})
+            elif cid not in found:
+                errors.append({'error': 'Customer not found'})
 
-        # Sort by probability descending
-        results.sort(key=lambda x: x.get('churn_probability', 0), reverse=True)
+        return results, errors
 
-        return results
+    def _build_prediction(
+        self,
+        customer_id: str,
+        proba: float,
+        explanation: List[Dict[str, Any]],
+        risk_level: str,
+        confidence: str,
+        recommended_action: str
+    ) -> Prediction:
+        """Package a model prediction with its risk level and recommended action."""
+        return Prediction(
+            customer_id=customer_id,
+            churn_probability=float(proba),
+            risk_level=risk_level,
+            confidence=confidence,
+            explanation=explanation,
+            top_risk_factors=explanation[:3] if explanation else [],
+            recommended_action=recommended_action
+        )
 
     def _fallback_prediction(self, customer_id: str) -> Dict[str, Any]:
         """Fallback prediction using simple rules when model not available."""
-        # Get customer data directly from database
-        query = f"""
+        predictions = self._fallback_predictions([customer_id])
+        return predictions[0].to_dict() if predictions else {'error': 'Customer not found'}
+
+    def _fallback_predictions(self, customer_ids: List[str]) -> List[Prediction]:
+        """
+        Rule-based predictions for many active customers at once.
+
+        The stored churn probability is used where present; otherwise the
+        simple rule score is computed in the query. Customers that are not
+        found are omitted.
+        """
+        if not customer_ids:
+            return []
+
+        query = """
             SELECT
-                c.customer_id,
-                c.company_size,
-                c.current_mrr,
-                c.churn_probability,
-                c.health_score,
-                c.latest_nps_score
-            FROM customers c
-            WHERE c.customer_id = '{customer_id}'
-            AND c.status = 'Active'
+                customer_id,
+                health_score,
+                COALESCE(latest_nps_score <= 6, FALSE) as low_nps,
+                COALESCE(
+                    churn_probability,
+                    0.3
+                    + CASE health_score WHEN 'Red' THEN 0.3 WHEN 'Yellow' THEN 0.15 ELSE 0 END
+                    + CASE WHEN latest_nps_score <= 6 THEN 0.2 ELSE 0 END
+                ) as proba
+            FROM customers
+            WHERE customer_id IN (SELECT UNNEST($customer_ids))
+            AND status = 'Active'
         """
-        df = query_to_df(query)
+        df = query_to_df(query, {'customer_ids': list(customer_ids)})
 
-        if df.empty:
-            return {'error': 'Customer not found'}
+        results = []
+        for row in df.itertuples(index=False):
+            proba = float(row.proba)
+            low_nps = bool(row.low_nps)
+
+            results.append(Prediction(
+                customer_id=row.customer_id,
+                churn_probability=proba,
+                risk_level=self._get_risk_level(proba),
+                confidence='Low (fallback model)',
+                explanation=[
+                    {
+                        'factor': 'Health Score',
+                        'impact': 'High' if row.health_score == 'Red' else 'Medium'
+                    },
+                    {'factor': 'NPS Score', 'impact': 'High' if low_nps else 'Low'}
+                ],
+                top_risk_factors=['Health Score', 'NPS Score'],
+                recommended_action=self._get_recommended_action(proba, [])
+            ))
 
-        row = df.iloc[0]
+        return results
 
-        # Use stored probability or calculate simple one
-        if row['churn_probability']:
-            proba = float(row['churn_probability'])
-        else:
-            # Simple rule-based probability
-            proba = 0.3
-            if row['health_score'] == 'Red':
-                proba += 0.3
-            elif row['health_score'] == 'Yellow':
-                proba += 0.15
-            if row['latest_nps_score'] and row['latest_nps_score'] <= 6:
-                proba += 0.2
-
-        risk_level = self._get_risk_level(proba)
-
-        return {
-            'customer_id': customer_id,
-            'churn_probability': proba,
-            'risk_level': risk_level,
-            'confidence': 'Low (fallback model)',
-            'explanation': [
-                {'factor': 'Health Score', 'impact': 'High' if row['health_score'] == 'Red' else 'Medium'},
-                {'factor': 'NPS Score', 'impact': 'High' if row['latest_nps_score'] and row['latest_nps_score'] <= 6 else 'Low'}
-            ],
-            'top_risk_factors': ['Health Score', 'NPS Score'],
-            'recommended_action': self._get_recommended_action(proba, [])
-        }
+    def _get_customer_features(self, customer_ids: List[str]) -> pd.DataFrame:
+        """
+        Get feature values for many active customers, one row per customer.
 
-    def _get_customer_features(self, customer_id: str) -> Optional[pd.Series]:
-        """Get feature values for a customer."""
-        query = f"""
+        Customer attributes, usage aggregates, usage trend and MRR movement
+        counts come from a single query; derived features are computed as
+        column expressions.
+        """
+        if not customer_ids:
+            return pd.DataFrame(columns=['customer_id'])
+
+        query = """
+            WITH usage_agg AS (
+                SELECT
+                    customer_id,
+                    AVG(logins) as avg_logins,
+                    AVG(api_calls) as avg_api_calls,
+                    AVG(reports_generated) as avg_reports,
+                    AVG(team_members_active) as avg_team_active,
+                    STDDEV(logins) as std_logins,
+                    AVG(CASE WHEN event_date >= CURRENT_DATE - INTERVAL 14 DAY
+                             THEN logins END) as recent_logins,
+                    AVG(CASE WHEN event_date < CURRENT_DATE - INTERVAL 14 DAY
+                              AND event_date >= CURRENT_DATE - INTERVAL 28 DAY
+                             THEN logins END) as prior_logins
+                FROM usage_events
+                WHERE customer_id IN (SELECT UNNEST($customer_ids))
+                AND event_date >= CURRENT_DATE - INTERVAL 60 DAY
+                GROUP BY customer_id
+            ),
+            mrr_agg AS (
+                SELECT
+                    customer_id,
+                    SUM(CASE WHEN movement_type = 'Expansion' THEN 1 ELSE 0 END)
+                        as expansion_count,
+                    SUM(CASE WHEN movement_type = 'Contraction' THEN 1 ELSE 0 END)
+                        as contraction_count
+                FROM mrr_movements
+                WHERE customer_id IN (SELECT UNNEST($customer_ids))
+                GROUP BY customer_id
+            )
             SELECT
                 c.customer_id,
                 c.company_size,
@@ -189,148 +509,156 @@ class ChurnPredictor:
                 c.initial_mrr,
                 c.current_mrr,
                 c.latest_nps_score,
-                DATEDIFF('day', c.start_date, CURRENT_DATE) as tenure_days
+                DATEDIFF('day', c.start_date, CURRENT_DATE) as tenure_days,
+                u.avg_logins,
+                u.avg_api_calls,
+                u.avg_reports,
+                u.avg_team_active,
+                u.std_logins,
+                u.recent_logins,
+                u.prior_logins,
+                m.expansion_count,
+                m.contraction_count
             FROM customers c
-            WHERE c.customer_id = '{customer_id}'
+            LEFT JOIN usage_agg u USING (customer_id)
+            LEFT JOIN mrr_agg m USING (customer_id)
+            WHERE c.customer_id IN (SELECT UNNEST($customer_ids))
             AND c.status = 'Active'
         """
-        customer_df = query_to_df(query)
-
-        if customer_df.empty:
-            return None
-
-        # Get usage features
-        usage_query = f"""
-            SELECT
-                AVG(logins) as avg_logins,
-                AVG(api_calls) as avg_api_calls,
-                AVG(reports_generated) as avg_reports,
-                AVG(team_members_active) as avg_team_active,
-                STDDEV(logins) as std_logins
-            FROM usage_events
-            WHERE customer_id = '{customer_id}'
-            AND event_date >= CURRENT_DATE - INTERVAL 60 DAY
-        """
-        usage_df = query_to_df(usage_query)
-
-        # Get usage trend
-        trend_query = f"""
-            SELECT
-                AVG(CASE WHEN event_date >= CURRENT_DATE - INTERVAL 14 DAY THEN logins END) as recent_logins,
-                AVG(CASE WHEN event_date < CURRENT_DATE - INTERVAL 14 DAY
-                          AND event_date >= CURRENT_DATE - INTERVAL 28 DAY THEN logins END) as prior_logins
-            FROM usage_events
-            WHERE customer_id = '{customer_id}'
-            AND event_date >= CURRENT_DATE - INTERVAL 28 DAY
-        """
-        trend_df = query_to_df(trend_query)
-
-        # Get MRR movements
-        mrr_query = f"""
-            SELECT
-                SUM(CASE WHEN movement_type = 'Expansion' THEN 1 ELSE 0 END) as expansion_count,
-                SUM(CASE WHEN movement_type = 'Contraction' THEN 1 ELSE 0 END) as contraction_count
-            FROM mrr_movements
-            WHERE customer_id = '{customer_id}'
-        """
-        mrr_df = query_to_df(mrr_query)
+        df = query_to_df(query, {'customer_ids': list(customer_ids)})
 
-        # Combine features
-        features = customer_df.iloc[0].to_dict()
-
-        if not usage_df.empty:
-            features.update(usage_df.iloc[0].to_dict())
-
-        if not trend_df.empty:
-            trend = trend_df.iloc[0]
-            recent = trend['recent_logins'] or 0
-            prior = trend['prior_logins'] or 1
-            features['usage_trend'] = (recent - prior) / prior if prior > 0 else 0
+        if df.empty:
+            return df
 
-        if not mrr_df.empty:
-            features.update(mrr_df.iloc[0].to_dict())
+        # Usage trend; a prior average of 0 is treated as 1
+        prior = df['prior_logins'].where(df['prior_logins'] != 0, 1)
+        df['usage_trend'] = np.where(prior > 0, (df['recent_logins'] - prior) / prior, 0)
+        df = df.drop(columns=['recent_logins', 'prior_logins'])
 
         # Calculate derived features
-        if features.get('initial_mrr', 0) > 0:
-            features['mrr_change'] = (features.get('current_mrr', 0) - features['initial_mrr']) / features['initial_mrr']
-        else:
-            features['mrr_change'] = 0
-
-        # NPS category
-        nps = features.get('latest_nps_score')
-        if nps is None:
-            features['nps_category'] = 'Passive'
-        elif nps >= 9:
-            features['nps_category'] = 'Promoter'
-        elif nps >= 7:
-            features['nps_category'] = 'Passive'
-        else:
-            features['nps_category'] = 'Detractor'
-
-        return pd.Series(features)
+        df['mrr_change'] = np.where(
+            df['initial_mrr'] > 0,
+            (df['current_mrr'] - df['initial_mrr']) / df['initial_mrr'],
+            0
+        )
 
-    def _prepare_features(self, features: pd.Series) -> np.ndarray:
-        """Prepare feature vector for prediction."""
-        # Encode categorical features
-        encoded = features.copy()
+        # NPS category code as in training (a missing score is Passive),
+        # plus its label for explanations
+        codes = np.digitize(df['latest_nps_score'].fillna(7).to_numpy(), NPS_CATEGORY_BINS)
+        df['nps_category_encoded'] = codes.astype(np.int8)
+        df['nps_category'] = np.asarray(NPS_CATEGORIES)[codes]
 
-        for col, encoder in self.trainer.label_encoders.items():
-            if col in encoded.index:
-                try:
-                    encoded[f'{col}_encoded'] = encoder.transform([str(encoded[col])])[0]
-                except:
-                    encoded[f'{col}_encoded'] = 0
+        return df
 
-        # Get feature columns
-        feature_cols = self.trainer.get_feature_columns()
-        available = [f for f in feature_cols if f in encoded.index]
-
-        # Build feature vector
-        X = pd.DataFrame([encoded[available]]).fillna(0)
-
-        # Scale
-        X_scaled = self.trainer.scaler.transform(X)
+    def _prepare_features(self, features: pd.DataFrame) -> np.ndarray:
+        """
+        Prepare the scaled feature matrix, one row per customer.
 
-        return X_scaled
+        Columns are filled straight into a float64 array in model feature
+        order, encoding categorical columns through the lookup maps.
+        """
+        n_rows = len(features)
+        columns = []
+        for name in self._feature_cols:
+            base = name[:-len('_encoded')] if name.endswith('_encoded') else None
+            if base in self._encoder_maps and base in features.columns:
+                # Unseen categories encode as -1, matching the trainer
+                columns.append(
+                    features[base].astype(str).map(self._encoder_maps[base])
+                    .fillna(-1).to_numpy(np.float64)
+                )
+            elif name in features.columns:
+                columns.append(features[name].to_numpy(np.float64, na_value=0.0))
+
+        X = np.empty((n_rows, len(columns)), dtype=np.float64)
+        for j, values in enumerate(columns):
+            X[:, j] = values
+
+        # Same affine map as StandardScaler.transform, applied to the bare
+        # array without sklearn's per-call input validation
+        scaler = self.trainer.scaler
+        X -= scaler.mean_
+        X /= scaler.scale_
+        return X
 
     def _explain_prediction(
         self,
         X: np.ndarray,
-        features: pd.Series
+        features: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """Generate explanation for prediction using SHAP."""
-        explanation = []
+        shap_values = self._shap_values(X)
+        return self._explain_from_shap_row(
+            shap_values[0] if shap_values is not None else None,
+            features, self._explanation_names(features.keys())
+        )
+
+    def _explanation_names(self, columns) -> List[str]:
+        """Model features available from the given feature columns, in SHAP column order."""
+        present = set(columns)
+        return [
+            f for f in self._feature_cols
+            if f in present or f.replace('_encoded', '') in present
+        ]
+
+    def _shap_values(self, X: np.ndarray) -> Optional[np.ndarray]:
+        """SHAP values of the positive class for every row of X, or None if unavailable."""
+        if not (self.explainer and HAS_SHAP):
+            return None
 
-        if self.explainer and HAS_SHAP:
-            try:
+        try:
+            with self._predict_lock:
                 shap_values = self.explainer.shap_values(X)
+        except Exception:
+            return None
 
-                # Handle different SHAP output formats
-                if isinstance(shap_values, list):
-                    shap_values = shap_values[1]  # Get positive class
-
-                feature_names = self.trainer.get_feature_columns()
-                available_names = [f for f in feature_names if f in features.index or f.replace('_encoded', '') in features.index]
-
-                for i, (name, shap_val) in enumerate(zip(available_names, shap_values[0])):
-                    if abs(shap_val) > 0.01:  # Only significant factors
-                        # Get original value
-                        original_name = name.replace('_encoded', '')
-                        value = features.get(original_name, features.get(name, 'N/A'))
+        # Handle different SHAP output formats
+        if isinstance(shap_values, list):
+            shap_values = shap_values[1]  # Get positive class
+        return np.asarray(shap_values)
 
-                        explanation.append({
-                            'factor': self._format_feature_name(name),
-                            'value': value,
-                            'shap_value': float(shap_val),
-                            'impact': 'Increases risk' if shap_val > 0 else 'Decreases risk',
-                            'magnitude': 'High' if abs(shap_val) > 0.1 else 'Medium' if abs(shap_val) > 0.05 else 'Low'
-                        })
+    def _explain_from_shap_row(
+        self,
+        shap_row: Optional[np.ndarray],
+        features: Dict[str, Any],
+        available_names: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the top explanation factors from one customer's SHAP values.
 
-                # Sort by absolute SHAP value
-                explanation.sort(key=lambda x: abs(x['shap_value']), reverse=True)
+        features is the customer's row as plain Python values, so explanation
+        values serialize as they are.
+        """
+        explanation = []
 
-            except Exception as e:
-                pass
+        if shap_row is not None:
+            shap_row = np.asarray(shap_row)[:len(available_names)]
+            magnitudes = np.abs(shap_row)
+
+            # Only significant factors, largest absolute SHAP value first
+            # (ties in feature order); dicts are built for the top 5 only
+            significant = np.flatnonzero(magnitudes > 0.01)
+            top = significant[np.argsort(-magnitudes[significant], kind='stable')[:5]]
+
+            for j in top.tolist():
+                name = available_names[j]
+                shap_val = float(shap_row[j])
+
+                # Get original value
+                original_name = name.replace('_encoded', '')
+                value = features.get(original_name, features.get(name, 'N/A'))
+
+                explanation.append({
+                    'factor': self._format_feature_name(name),
+                    'value': value,
+                    'shap_value': shap_val,
+                    'impact': 'Increases risk' if shap_val > 0 else 'Decreases risk',
+                    'magnitude': (
+                        'High' if abs(shap_val) > 0.1
+                        else 'Medium' if abs(shap_val) > 0.05
+                        else 'Low'
+                    )
+                })
 
         # Fallback to rule-based explanation
         if not explanation:
@@ -338,30 +666,30 @@ class ChurnPredictor:
 
         return explanation[:5]  # Return top 5
 
-    def _rule_based_explanation(self, features: pd.Series) -> List[Dict[str, Any]]:
+    def _rule_based_explanation(self, values: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate rule-based explanation when SHAP not available."""
         explanation = []
 
         # Check usage
-        if features.get('avg_logins', 0) < 5:
+        if values.get('avg_logins', 0) < 5:
             explanation.append({
                 'factor': 'Low Login Activity',
-                'value': f"{features.get('avg_logins', 0):.1f} avg/day",
+                'value': f"{values.get('avg_logins', 0):.1f} avg/day",
                 'impact': 'Increases risk',
                 'magnitude': 'High'
             })
 
         # Check usage trend
-        if features.get('usage_trend', 0) < -0.2:
+        if values.get('usage_trend', 0) < -0.2:
             explanation.append({
                 'factor': 'Declining Usage',
-                'value': f"{features.get('usage_trend', 0):.1%}",
+                'value': f"{values.get('usage_trend', 0):.1%}",
                 'impact': 'Increases risk',
                 'magnitude': 'High'
             })
 
         # Check NPS
-        nps = features.get('latest_nps_score')
+        nps = values.get('latest_nps_score')
         if nps is not None and nps <= 6:
             explanation.append({
                 'factor': 'Low NPS Score',
@@ -371,47 +699,29 @@ class ChurnPredictor:
             })
 
         # Check tenure
-        if features.get('tenure_days', 0) < 90:
+        if values.get('tenure_days', 0) < 90:
             explanation.append({
                 'factor': 'New Customer',
-                'value': f"{features.get('tenure_days', 0)} days",
+                'value': f"{values.get('tenure_days', 0)} days",
                 'impact': 'Increases risk',
                 'magnitude': 'Medium'
             })
 
         # Check MRR change
-        if features.get('mrr_change', 0) < 0:
+        if values.get('mrr_change', 0) < 0:
             explanation.append({
                 'factor': 'Revenue Decline',
-                'value': f"{features.get('mrr_change', 0):.1%}",
+                'value': f"{values.get('mrr_change', 0):.1%}",
                 'impact': 'Increases risk',
                 'magnitude': 'Medium'
             })
 
         return explanation
 
-    def _format_feature_name(self, name: str) -> str:
+    @staticmethod
+    def _format_feature_name(name: str) -> str:
         """Convert feature name to readable format."""
-        mapping = {
-            'tenure_days': 'Account Tenure',
-            'initial_mrr': 'Initial MRR',
-            'current_mrr': 'Current MRR',
-            'avg_logins': 'Average Logins',
-            'avg_api_calls': 'API Usage',
-            'avg_reports': 'Report Generation',
-            'avg_team_active': 'Active Team Size',
-            'std_logins': 'Login Consistency',
-            'usage_trend': 'Usage Trend',
-            'mrr_change': 'Revenue Change',
-            'expansion_count': 'Expansions',
-            'contraction_count': 'Contractions',
-            'latest_nps_score': 'NPS Score',
-            'company_size_encoded': 'Company Size',
-            'industry_encoded': 'Industry',
-            'channel_encoded': 'Acquisition Channel',
-            'nps_category_encoded': 'NPS Category'
-        }
-        return mapping.get(name, name.replace('_', ' ').title())
+        return FEATURE_DISPLAY_NAMES.get(name) or name.replace('_', ' ').title()
 
     def _get_risk_level(self, probability: float) -> str:
         """Determine risk level from probability."""
@@ -450,6 +760,18 @@ class ChurnPredictor:
             return "Continue standard engagement"
 
 
+@functools.lru_cache(maxsize=1)
+def get_predictor() -> ChurnPredictor:
+    """
+    Get the shared ChurnPredictor, loaded once per process.
+
+    Constructing a predictor loads the model and builds the SHAP explainer,
+    so callers reuse this instance. Under a multi-worker server each worker
+    process holds its own predictor.
+    """
+    return ChurnPredictor()
+
+
 def get_predictions_for_segment(
     segment: str,
     segment_value: str,
@@ -459,15 +781,16 @@ def get_predictions_for_segment(
     # Validate segment and value
     segment, segment_value = validate_segment(segment, segment_value)
 
-    predictor = ChurnPredictor()
+    predictor = get_predictor()
 
+    # The segment column is whitelisted above; its value is bound as a parameter
     query = f"""
         SELECT customer_id
         FROM customers
         WHERE status = 'Active'
-        AND {segment} = '{segment_value}'
+        AND {segment} = $segment_value
     """
-    df = query_to_df(query)
+    df = query_to_df(query, {'segment_value': segment_value})
 
     if df.empty:
         return []
@@ -480,9 +803,31 @@ def get_high_risk_customers(
     threshold: float = 0.5,
     limit: int = 100
 ) -> List[Dict[str, Any]]:
-    """Get customers with churn probability above threshold."""
-    predictor = ChurnPredictor()
-    all_predictions = predictor.predict_batch()
+    """
+    Get customers with churn probability above threshold.
+
+    This is an approximation of scoring every active customer: only
+    customers whose stored churn probability is within PRESCREEN_MARGIN of
+    the threshold, or whose health score is Yellow or Red, are scored. A
+    customer the model would put above the threshold can be missed if
+    neither stored signal flags them.
+    """
+    predictor = get_predictor()
+
+    # Only score customers whose stored risk signals put them near the
+    # threshold; the model still ranks every candidate
+    query = """
+        SELECT customer_id
+        FROM customers
+        WHERE status = 'Active'
+        AND (
+            COALESCE(churn_probability, 0.5) >= $min_probability
+            OR health_score IN ('Yellow', 'Red')
+        )
+    """
+    candidates = query_to_df(query, {'min_probability': max(0.0, threshold - PRESCREEN_MARGIN)})
+    predictions, _ = predictor.score_batch(candidates['customer_id'].tolist())
 
-    high_risk = [p for p in all_predictions if p.get('churn_probability', 0) >= threshold]
-    return high_risk[:limit]
+    # Only the rows returned are converted to dicts
+    high_risk = [p for p in predictions if p.churn_probability >= threshold]
+    return [p.to_dict() for p in high_risk[:limit]]
@@ -10,14 +10,18 @@ Provides churn prediction model training including:
 - Feature importance analysis
 """
 
-import pickle
+import functools
+import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+import joblib
+from typing import Callable, Dict, List, Tuple, Optional, Any
 from datetime import date, timedelta
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split, TimeSeriesSplit
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import (
     roc_auc_score, precision_recall_curve, average_precision_score,
     classification_report, confusion_matrix
@@ -29,12 +33,67 @@ try:
 except ImportError:
     HAS_XGBOOST = False
 
-from data.database import query_to_df
+from data.database import query_to_df, get_data_version
 
 # Model storage path
 MODEL_DIR = Path(__file__).parent / "saved_models"
 MODEL_DIR.mkdir(exist_ok=True)
 
+# Cached output of prepare_features, with a sidecar recording the data
+# version and date it was built from
+FEATURE_CACHE_PATH = MODEL_DIR / "features.parquet"
+FEATURE_CACHE_META_PATH = MODEL_DIR / "features.meta.json"
+
+# Bump whenever the columns prepare_features produces change, so older
+# caches are rebuilt
+FEATURE_CACHE_VERSION = 2
+
+# NPS category codes: scores below 7 are Detractors, 7-8 Passives and
+# 9-10 Promoters; NPS_CATEGORIES is indexed by code
+NPS_CATEGORY_BINS = (7, 9)
+NPS_CATEGORIES = ('Detractor', 'Passive', 'Promoter')
+
+# Upper bound on XGBoost training threads; hist training stops scaling
+# (and can slow down) beyond this on SMT/NUMA hosts
+MAX_TRAIN_THREADS = 8
+
+# Model feature columns, in the order the scaler and model were fitted on
+FEATURE_COLUMNS = (
+    'tenure_days',
+    'initial_mrr',
+    'current_mrr',
+    'avg_logins',
+    'avg_api_calls',
+    'avg_reports',
+    'avg_team_active',
+    'std_logins',
+    'usage_trend',
+    'mrr_change',
+    'expansion_count',
+    'contraction_count',
+    'latest_nps_score',
+    'company_size_encoded',
+    'industry_encoded',
+    'channel_encoded',
+    'nps_category_encoded',
+)
+
+
+def _write_atomic(path: Path, write: Callable[[str], None]):
+    """Write a file via a temporary file in the same directory and os.replace()."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        # mkstemp creates the file as 0600; give it the mode a plain open() would
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
 
 class ChurnModelTrainer:
     """Trains and evaluates churn prediction models."""
@@ -46,10 +105,100 @@ class ChurnModelTrainer:
         self.feature_names = []
         self.training_metrics = {}
 
-    def prepare_features(self) -> pd.DataFrame:
-        """Prepare feature matrix for training."""
-        # Get customer data with features
+    def prepare_features(self, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Prepare feature matrix for training.
+
+        The result is cached as parquet and reused until the database
+        changes or the date rolls over (features are relative to
+        CURRENT_DATE).
+        """
+        cache_key = {
+            'cache_version': FEATURE_CACHE_VERSION,
+            'data_version': get_data_version(),
+            'as_of': date.today().isoformat()
+        }
+
+        if use_cache:
+            df = self._load_cached_features(cache_key)
+            if df is not None:
+                return df
+
+        df = self._build_features()
+        self._save_cached_features(df, cache_key)
+        return df
+
+    def _load_cached_features(self, cache_key: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Cached feature frame if it was built for cache_key, else None."""
+        if not (FEATURE_CACHE_PATH.exists() and FEATURE_CACHE_META_PATH.exists()):
+            return None
+
+        try:
+            meta = json.loads(FEATURE_CACHE_META_PATH.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if meta != cache_key:
+            return None
+
+        return pd.read_parquet(FEATURE_CACHE_PATH)
+
+    def _save_cached_features(self, df: pd.DataFrame, cache_key: Dict[str, Any]):
+        """
+        Write the feature cache.
+
+        Both files are written to a temporary file and moved into place, so
+        concurrent readers (e.g. parallel test workers) only ever see
+        complete files; the sidecar is replaced last.
+        """
+        FEATURE_CACHE_META_PATH.unlink(missing_ok=True)
+        _write_atomic(
+            FEATURE_CACHE_PATH,
+            lambda path: df.to_parquet(path, compression='zstd', index=False)
+        )
+        _write_atomic(
+            FEATURE_CACHE_META_PATH,
+            lambda path: Path(path).write_text(json.dumps(cache_key))
+        )
+
+    def _build_features(self) -> pd.DataFrame:
+        """
+        Query and derive the feature matrix.
+
+        Customer attributes, usage aggregates, usage trend windows and MRR
+        movement counts come from a single query, so usage_events is
+        scanned once.
+        """
         query = """
+            WITH usage_agg AS (
+                SELECT
+                    customer_id,
+                    AVG(logins) as avg_logins,
+                    AVG(api_calls) as avg_api_calls,
+                    AVG(reports_generated) as avg_reports,
+                    AVG(team_members_active) as avg_team_active,
+                    STDDEV(logins) as std_logins,
+                    MAX(logins) as max_logins,
+                    MIN(logins) as min_logins,
+                    AVG(logins) FILTER (WHERE event_date >= CURRENT_DATE - INTERVAL 14 DAY)
+                        as recent_logins,
+                    AVG(logins) FILTER (WHERE event_date < CURRENT_DATE - INTERVAL 14 DAY
+                                          AND event_date >= CURRENT_DATE - INTERVAL 28 DAY)
+                        as prior_logins
+                FROM usage_events
+                WHERE event_date >= CURRENT_DATE - INTERVAL 60 DAY
+                GROUP BY customer_id
+            ),
+            mrr_agg AS (
+                SELECT
+                    customer_id,
+                    SUM(CASE WHEN movement_type = 'Expansion' THEN 1 ELSE 0 END)
+                        as expansion_count,
+                    SUM(CASE WHEN movement_type = 'Contraction' THEN 1 ELSE 0 END)
+                        as contraction_count
+                FROM mrr_movements
+                GROUP BY customer_id
+            )
             SELECT
                 c.customer_id,
                 c.company_size,
@@ -63,60 +212,30 @@ class ChurnModelTrainer:
                 c.latest_nps_score,
                 DATEDIFF('day', c.start_date,
                     CASE WHEN c.status = 'Churned' THEN c.churn_date ELSE CURRENT_DATE END
-                ) as tenure_days
+                ) as tenure_days,
+                u.avg_logins,
+                u.avg_api_calls,
+                u.avg_reports,
+                u.avg_team_active,
+                u.std_logins,
+                u.max_logins,
+                u.min_logins,
+                u.recent_logins,
+                u.prior_logins,
+                m.expansion_count,
+                m.contraction_count
             FROM customers c
+            LEFT JOIN usage_agg u USING (customer_id)
+            LEFT JOIN mrr_agg m USING (customer_id)
         """
-        customers_df = query_to_df(query)
-
-        # Get usage features for each customer
-        usage_query = """
-            SELECT
-                customer_id,
-                AVG(logins) as avg_logins,
-                AVG(api_calls) as avg_api_calls,
-                AVG(reports_generated) as avg_reports,
-                AVG(team_members_active) as avg_team_active,
-                STDDEV(logins) as std_logins,
-                MAX(logins) as max_logins,
-                MIN(logins) as min_logins
-            FROM usage_events
-            WHERE event_date >= CURRENT_DATE - INTERVAL 60 DAY
-            GROUP BY customer_id
-        """
-        usage_df = query_to_df(usage_query)
-
-        # Get usage trend (recent vs prior)
-        trend_query = """
-            SELECT
-                customer_id,
-                AVG(CASE WHEN event_date >= CURRENT_DATE - INTERVAL 14 DAY THEN logins END) as recent_logins,
-                AVG(CASE WHEN event_date < CURRENT_DATE - INTERVAL 14 DAY
-                          AND event_date >= CURRENT_DATE - INTERVAL 28 DAY THEN logins END) as prior_logins
-            FROM usage_events
-            WHERE event_date >= CURRENT_DATE - INTERVAL 28 DAY
-            GROUP BY customer_id
-        """
-        trend_df = query_to_df(trend_query)
+        df = query_to_df(query)
 
-        # Get MRR movement history
-        mrr_query = """
-            SELECT
-                customer_id,
-                SUM(CASE WHEN movement_type = 'Expansion' THEN 1 ELSE 0 END) as expansion_count,
-                SUM(CASE WHEN movement_type = 'Contraction' THEN 1 ELSE 0 END) as contraction_count
-            FROM mrr_movements
-            GROUP BY customer_id
-        """
-        mrr_df = query_to_df(mrr_query)
-
-        # Merge all features
-        df = customers_df.merge(usage_df, on='customer_id', how='left')
-        df = df.merge(trend_df, on='customer_id', how='left')
-        df = df.merge(mrr_df, on='customer_id', how='left')
-
-        # Fill missing values
+        # Fill missing values column by column, touching only columns that
+        # have any, instead of copying every numeric column at once
         numeric_cols = df.select_dtypes(include=[np.number]).columns
-        df[numeric_cols] = df[numeric_cols].fillna(0)
+        for col in numeric_cols:
+            if df[col].hasnans:
+                df[col] = df[col].fillna(0)
 
         # Create target variable
         df['churned'] = (df['status'] == 'Churned').astype(int)
@@ -135,60 +254,58 @@ class ChurnModelTrainer:
             0
         )
 
-        # NPS category
-        df['nps_category'] = pd.cut(
-            df['latest_nps_score'].fillna(7),
-            bins=[-1, 6, 8, 10],
-            labels=['Detractor', 'Passive', 'Promoter']
-        )
+        # NPS category, encoded directly as its code
+        scores = df['latest_nps_score'].fillna(7).to_numpy()
+        df['nps_category_encoded'] = np.digitize(scores, NPS_CATEGORY_BINS).astype(np.int8)
 
         return df
 
     def encode_categorical(self, df: pd.DataFrame, fit: bool = True) -> pd.DataFrame:
-        """Encode categorical variables."""
-        categorical_cols = ['company_size', 'industry', 'channel', 'nps_category']
+        """
+        Encode categorical variables.
+
+        Codes are positions in the sorted category array, as LabelEncoder
+        would assign them; label_encoders keeps that array per column.
+        Unseen categories encode as -1 when fit is False.
+        """
+        categorical_cols = ['company_size', 'industry', 'channel']
 
         for col in categorical_cols:
             if col in df.columns:
+                values = df[col].astype(str).to_numpy()
                 if fit:
-                    self.label_encoders[col] = LabelEncoder()
-                    df[f'{col}_encoded'] = self.label_encoders[col].fit_transform(df[col].astype(str))
+                    categories, codes = np.unique(values, return_inverse=True)
+                    self.label_encoders[col] = categories
                 else:
-                    df[f'{col}_encoded'] = self.label_encoders[col].transform(df[col].astype(str))
+                    categories = self.label_encoders[col]
+                    codes = np.searchsorted(categories, values)
+                    found = categories[np.minimum(codes, len(categories) - 1)] == values
+                    codes = np.where(found, codes, -1)
+                df[f'{col}_encoded'] = codes.astype(np.int32)
 
         return df
 
     def get_feature_columns(self) -> List[str]:
         """Get list of feature columns for model."""
-        return [
-            'tenure_days',
-            'initial_mrr',
-            'current_mrr',
-            'avg_logins',
-            'avg_api_calls',
-            'avg_reports',
-            'avg_team_active',
-            'std_logins',
-            'usage_trend',
-            'mrr_change',
-            'expansion_count',
-            'contraction_count',
-            'latest_nps_score',
-            'company_size_encoded',
-            'industry_encoded',
-            'channel_encoded',
-            'nps_category_encoded'
-        ]
+        return list(FEATURE_COLUMNS)
+
+    def get_available_features(self, df: pd.DataFrame) -> List[str]:
+        """Get the model feature columns present in a DataFrame, in model order."""
+        columns = set(df.columns)
+        return [f for f in FEATURE_COLUMNS if f in columns]
 
     def train(
         self,
         test_size: float = 0.2,
-        validation_size: float = 0.1
+        validation_size: float = 0.1,
+        nthread: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Train the churn prediction model.
 
-        Uses time-based splitting to prevent data leakage.
+        Uses time-based splitting to prevent data leakage. nthread caps the
+        training threads; by default XGBoost uses the physical cores, up to
+        MAX_TRAIN_THREADS, and the RandomForest fallback uses every core.
         """
         print("Preparing features...")
         df = self.prepare_features()
@@ -196,37 +313,37 @@ class ChurnModelTrainer:
 
         # Get feature columns
         self.feature_names = self.get_feature_columns()
-        available_features = [f for f in self.feature_names if f in df.columns]
+        available_features = self.get_available_features(df)
 
-        X = df[available_features].fillna(0)
-        y = df['churned']
+        # Feature matrix straight from the frame as float32, which halves
+        # the bytes XGBoost reads when building histograms
+        X = df.loc[:, available_features].to_numpy(dtype=np.float32, na_value=0.0)
 
-        # Time-based split using start_date
-        df_sorted = df.sort_values('start_date')
-        n = len(df_sorted)
+        # Time-based split using start_date: reorder X and y once, then
+        # take contiguous slices
+        order = np.argsort(df['start_date'].to_numpy(), kind='stable')
+        X_arr = X[order]
+        y_arr = df['churned'].to_numpy()[order]
+        n = len(order)
 
         train_end = int(n * (1 - test_size - validation_size))
         val_end = int(n * (1 - test_size))
 
-        train_idx = df_sorted.index[:train_end]
-        val_idx = df_sorted.index[train_end:val_end]
-        test_idx = df_sorted.index[val_end:]
-
-        X_train = X.loc[train_idx]
-        y_train = y.loc[train_idx]
-        X_val = X.loc[val_idx]
-        y_val = y.loc[val_idx]
-        X_test = X.loc[test_idx]
-        y_test = y.loc[test_idx]
+        X_train, y_train = X_arr[:train_end], y_arr[:train_end]
+        X_val, y_val = X_arr[train_end:val_end], y_arr[train_end:val_end]
+        X_test, y_test = X_arr[val_end:], y_arr[val_end:]
 
         print(f"Training set: {len(X_train)} samples")
         print(f"Validation set: {len(X_val)} samples")
         print(f"Test set: {len(X_test)} samples")
 
-        # Scale features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_val_scaled = self.scaler.transform(X_val)
-        X_test_scaled = self.scaler.transform(X_test)
+        # Scale features: fit on the training rows, then apply the same
+        # affine map to the whole (freshly built) array in place, keeping
+        # float32
+        self.scaler.fit(X_train)
+        np.subtract(X_arr, self.scaler.mean_, out=X_arr)
+        np.divide(X_arr, self.scaler.scale_, out=X_arr)
+        X_train_scaled, X_val_scaled, X_test_scaled = X_train, X_val, X_test
 
         # Train model
         if HAS_XGBOOST:
@@ -239,7 +356,11 @@ class ChurnModelTrainer:
                 colsample_bytree=0.8,
                 random_state=42,
                 eval_metric='auc',
-                early_stopping_rounds=10
+                early_stopping_rounds=10,
+                tree_method='hist',
+                grow_policy='depthwise',
+                max_bin=256,
+                n_jobs=nthread or min(MAX_TRAIN_THREADS, joblib.cpu_count(only_physical_cores=True))
             )
 
             self.model.fit(
@@ -254,7 +375,8 @@ class ChurnModelTrainer:
             self.model = RandomForestClassifier(
                 n_estimators=100,
                 max_depth=6,
-                random_state=42
+                random_state=42,
+                n_jobs=nthread or -1
             )
             self.model.fit(X_train_scaled, y_train)
 
@@ -281,88 +403,104 @@ class ChurnModelTrainer:
         }
 
         # Get feature importance
-        if HAS_XGBOOST:
-            importance = self.model.feature_importances_
-        else:
-            importance = self.model.feature_importances_
+        importance = np.asarray(self.model.feature_importances_)
 
         self.training_metrics['feature_importance'] = dict(zip(available_features, importance.tolist()))
 
         return self.training_metrics
 
     def save_model(self, model_name: str = "churn_model"):
-        """Save trained model to disk."""
+        """
+        Save trained model to disk.
+
+        An XGBoost model is written in XGBoost's native UBJSON format; the
+        RandomForest fallback as an uncompressed joblib file. The scaler,
+        encoders and metadata go into one compressed joblib file.
+        """
         if self.model is None:
             raise ValueError("No model to save. Train the model first.")
 
-        model_path = MODEL_DIR / f"{model_name}.pkl"
-        scaler_path = MODEL_DIR / f"{model_name}_scaler.pkl"
-        encoders_path = MODEL_DIR / f"{model_name}_encoders.pkl"
-        metadata_path = MODEL_DIR / f"{model_name}_metadata.pkl"
+        model_path, booster_path, state_path = self._model_paths(model_name)
 
-        with open(model_path, 'wb') as f:
-            pickle.dump(self.model, f)
-
-        with open(scaler_path, 'wb') as f:
-            pickle.dump(self.scaler, f)
-
-        with open(encoders_path, 'wb') as f:
-            pickle.dump(self.label_encoders, f)
-
-        metadata = {
-            'feature_names': self.feature_names,
-            'training_metrics': self.training_metrics
+        if HAS_XGBOOST and isinstance(self.model, xgb.XGBClassifier):
+            self.model.save_model(booster_path)
+            model_path.unlink(missing_ok=True)
+        else:
+            # Uncompressed so the model's arrays can be memory-mapped on load
+            joblib.dump(self.model, model_path)
+            booster_path.unlink(missing_ok=True)
+
+        state = {
+            'scaler': self.scaler,
+            'encoders': self.label_encoders,
+            'metadata': {
+                'feature_names': self.feature_names,
+                'training_metrics': self.training_metrics
+            }
         }
-        with open(metadata_path, 'wb') as f:
-            pickle.dump(metadata, f)
+        joblib.dump(state, state_path, compress=3)
 
         print(f"Model saved to {MODEL_DIR}")
 
     def load_model(self, model_name: str = "churn_model") -> bool:
         """Load trained model from disk."""
-        model_path = MODEL_DIR / f"{model_name}.pkl"
-        scaler_path = MODEL_DIR / f"{model_name}_scaler.pkl"
-        encoders_path = MODEL_DIR / f"{model_name}_encoders.pkl"
-        metadata_path = MODEL_DIR / f"{model_name}_metadata.pkl"
+        model_path, booster_path, state_path = self._model_paths(model_name)
 
-        if not all(p.exists() for p in [model_path, scaler_path, encoders_path]):
+        if not state_path.exists():
             return False
 
-        with open(model_path, 'rb') as f:
-            self.model = pickle.load(f)
-
-        with open(scaler_path, 'rb') as f:
-            self.scaler = pickle.load(f)
-
-        with open(encoders_path, 'rb') as f:
-            self.label_encoders = pickle.load(f)
+        if booster_path.exists() and HAS_XGBOOST:
+            self.model = xgb.XGBClassifier()
+            self.model.load_model(booster_path)
+        elif model_path.exists():
+            # Memory-map the model's arrays: pages are read on demand and
+            # shared between processes loading the same file
+            self.model = joblib.load(model_path, mmap_mode='r')
+        else:
+            return False
 
-        if metadata_path.exists():
-            with open(metadata_path, 'rb') as f:
-                metadata = pickle.load(f)
-                self.feature_names = metadata.get('feature_names', [])
-                self.training_metrics = metadata.get('training_metrics', {})
+        state = joblib.load(state_path)
+        self.scaler = state['scaler']
+        self.label_encoders = state['encoders']
+        metadata = state.get('metadata', {})
+        self.feature_names = metadata.get('feature_names', [])
+        self.training_metrics = metadata.get('training_metrics', {})
 
         return True
 
+    @staticmethod
+    def _model_paths(model_name: str) -> Tuple[Path, Path, Path]:
+        """Paths of the joblib model, the XGBoost booster and the preprocessing state."""
+        return (
+            MODEL_DIR / f"{model_name}.pkl",
+            MODEL_DIR / f"{model_name}.ubj",
+            MODEL_DIR / f"{model_name}_state.joblib",
+        )
+
     def get_feature_importance(self) -> List[Dict[str, Any]]:
         """Get feature importance from trained model."""
         if self.model is None:
             return []
 
-        if HAS_XGBOOST:
-            importance = self.model.feature_importances_
-        else:
-            importance = self.model.feature_importances_
+        importance = np.asarray(self.model.feature_importances_)
 
         features = self.feature_names if self.feature_names else [f"feature_{i}" for i in range(len(importance))]
 
+        # Total computed once; an all-zero importance vector gives 0% everywhere
+        total = float(np.sum(importance)) or 1.0
+
+        # Largest first, ties in feature order; pairs up names and values
+        # like zip, up to the shorter of the two
+        importance = importance[:len(features)]
+        order = np.argsort(-importance, kind='stable')
+
         importance_list = []
-        for name, imp in sorted(zip(features, importance), key=lambda x: x[1], reverse=True):
+        for i in order.tolist():
+            imp = float(importance[i])
             importance_list.append({
-                'feature': name,
-                'importance': float(imp),
-                'importance_pct': float(imp / sum(importance)) if sum(importance) > 0 else 0
+                'feature': features[i],
+                'importance': imp,
+                'importance_pct': imp / total
             })
 
         return importance_list
@@ -373,11 +511,33 @@ def train_and_save_model() -> Dict[str, Any]:
     trainer = ChurnModelTrainer()
     metrics = trainer.train()
     trainer.save_model()
+
+    # Make the shared predictor pick up the new model
+    from .predict import ChurnPredictor
+    ChurnPredictor.invalidate()
+
     return metrics
 
 
 def get_model_info() -> Dict[str, Any]:
-    """Get information about the saved model."""
+    """
+    Get information about the saved model.
+
+    Loaded once per saved model: the result is cached on the modification
+    time of the model's state file, which save_model writes last, so a
+    model trained by any process is picked up on the next call.
+    """
+    _, _, state_path = ChurnModelTrainer._model_paths("churn_model")
+    try:
+        model_version = state_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        model_version = 0
+    return _load_model_info(model_version)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_model_info(model_version: int) -> Dict[str, Any]:
+    """Model info for one saved model version; see get_model_info."""
     trainer = ChurnModelTrainer()
     if trainer.load_model():
         return {
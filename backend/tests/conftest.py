@@ -5,6 +5,8 @@ Pytest Configuration and Fixtures
 Shared test fixtures for API testing.
 """
 
+import os
+import shutil
 import pytest
 from fastapi.testclient import TestClient
 import sys
@@ -15,12 +17,65 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 from api.main import app
+from data import database
+from models import calibration, predict, train
 
 
-@pytest.fixture
-def client():
+@pytest.fixture(scope="session", autouse=True)
+def worker_database(tmp_path_factory):
+    """
+    Give each pytest-xdist worker its own copy of the database.
+
+    DuckDB allows a single read-write process per database file, so
+    parallel workers cannot share it. Without xdist the application
+    database is used as is.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id is None:
+        yield database.DB_PATH
+        return
+
+    original_path = database.DB_PATH
+    worker_path = tmp_path_factory.mktemp(worker_id) / original_path.name
+    if original_path.exists():
+        shutil.copyfile(original_path, worker_path)
+
+    database.DB_PATH = worker_path
+    yield worker_path
+    database.DB_PATH = original_path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def model_dir(tmp_path_factory):
+    """
+    Point model storage and the feature cache at a temporary directory.
+
+    Tests never read or write models/saved_models, so a model left there
+    by a previous run is not picked up. Under pytest-xdist each worker
+    gets its own directory.
     """
-    Create a test client for the FastAPI application.
+    path = tmp_path_factory.mktemp("saved_models")
+    patch = pytest.MonkeyPatch()
+    for module in (train, predict, calibration):
+        patch.setattr(module, "MODEL_DIR", path)
+    patch.setattr(train, "FEATURE_CACHE_PATH", path / train.FEATURE_CACHE_PATH.name)
+    patch.setattr(train, "FEATURE_CACHE_META_PATH", path / train.FEATURE_CACHE_META_PATH.name)
+    predict.get_predictor.cache_clear()
+
+    yield path
+
+    patch.undo()
+    predict.get_predictor.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def client(worker_database, model_dir):
+    """
+    Create a test client for the FastAPI application, shared by the
+    whole session so app startup and shutdown run once.
+
+    Tests that change app state should undo it with function-scoped
+    monkeypatch overrides rather than a fresh client.
 
     Usage:
         def test_endpoint(client):
@@ -31,6 +86,12 @@ def client():
         yield test_client
 
 
+@pytest.fixture(scope="session")
+def trained_model(client):
+    """Train and save a churn model into the session's model directory."""
+    train.train_and_save_model()
+
+
 @pytest.fixture
 def sample_customer_data():
     """Sample customer data for testing."""
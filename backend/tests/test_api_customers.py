@@ -78,6 +78,27 @@ def test_at_risk_customers_endpoint(client):
         assert customer["churn_probability"] > 0.5
 
 
+def test_customer_prediction_with_trained_model(client, trained_model):
+    """Test a single-customer prediction served by the trained model."""
+    customers = client.get("/api/customers?limit=1").json()["customers"]
+    if not customers:
+        pytest.skip("No active customers")
+
+    customer_id = customers[0]["customer_id"]
+    response = client.get(f"/api/churn/predictions/{customer_id}")
+
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["customer_id"] == customer_id
+    assert 0 <= data["churn_probability"] <= 1
+    assert data["risk_level"] in ["Low", "Medium", "High", "Critical"]
+    assert isinstance(data["explanation"], list)
+    for factor in data["explanation"]:
+        assert "factor" in factor
+        assert "value" in factor
+
+
 def test_churn_summary_endpoint(client):
     """Test the churn summary endpoint."""
     response = client.get("/api/churn/summary")